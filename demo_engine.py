@@ -1,24 +1,24 @@
 #!/usr/bin/env python3
 """Demo script that runs one hand of Bestia with random legal actions."""
-import random
+import sys
 from engine.smazzata import Engine, Player, Action, Phase
 from engine.deck import Card
 
 
-def print_state(engine: Engine):
-    """Print current game state."""
+def format_state(engine: Engine) -> str:
+    """Render current game state as text."""
     snapshot = engine.snapshot()
-    print(f"\n=== Phase: {snapshot['phase']} ===")
-    print(f"Pot: {snapshot['pot']} cents")
-    print(f"Dealer: {snapshot['dealer']}")
+    lines = [f"\n=== Phase: {snapshot['phase']} ===",
+             f"Pot: {snapshot['pot']} cents",
+             f"Dealer: {snapshot['dealer']}"]
     if snapshot['briscola_card']:
-        print(f"Briscola: {snapshot['briscola_card']['value']} di {snapshot['briscola_card']['seed']}")
+        lines.append(f"Briscola: {snapshot['briscola_card']['value']} di {snapshot['briscola_card']['seed']}")
     
     if snapshot['current_actor']:
         actor = snapshot['current_actor']
-        print(f"Current actor: {actor['kind']} {actor['id']}")
+        lines.append(f"Current actor: {actor['kind']} {actor['id']}")
     
-    print("\nPlayers:")
+    lines.append("\nPlayers:")
     for p in snapshot['players']:
         status = []
         if p['is_playing']:
@@ -26,29 +26,42 @@ def print_state(engine: Engine):
         if p['in_buco']:
             status.append("in_buco")
         status_str = " (" + ", ".join(status) + ")" if status else ""
-        print(f"  {p['name']}: bankroll={p['bankroll']}, tricks={p['tricks_won']}, cards={p['num_cards']}{status_str}")
+        lines.append(f"  {p['name']}: bankroll={p['bankroll']}, tricks={p['tricks_won']}, cards={p['num_cards']}{status_str}")
     
     if snapshot['buchi']:
-        print("\nBuchi:")
+        lines.append("\nBuchi:")
         for b in snapshot['buchi']:
-            print(f"  Buco {b['buco_id']}: players={b['player_names']}, tricks={b['tricks_won']}, cards={b['num_cards']}")
+            lines.append(f"  Buco {b['buco_id']}: players={b['player_names']}, tricks={b['tricks_won']}, cards={b['num_cards']}")
     
     if snapshot['current_trick']:
-        print("\nCurrent trick:")
+        lines.append("\nCurrent trick:")
         for play in snapshot['current_trick']:
             actor = play['actor']
             card = play['card']
-            print(f"  {actor['kind']} {actor['id']}: {card['value']} di {card['seed']}")
+            lines.append(f"  {actor['kind']} {actor['id']}: {card['value']} di {card['seed']}")
     
-    print(f"Tricks completed: {snapshot['tricks_completed']}/3")
+    lines.append(f"Tricks completed: {snapshot['tricks_completed']}/3\n")
+    return "\n".join(lines)
+
+
+def print_state(engine: Engine):
+    """Print current game state."""
+    sys.stdout.write(format_state(engine))
+
+
+def render_trace(trace: list, players: list) -> str:
+    """Render states recorded with Engine.snapshot_bytes() through a scratch engine."""
+    replay = Engine([Player(p.name) for p in players])
+    chunks = []
+    for buf in trace:
+        replay.restore_bytes(buf)
+        chunks.append(format_state(replay))
+    return "".join(chunks)
 
 
 def get_random_action(engine: Engine) -> Action:
     """Get a random legal action."""
-    legal = engine.legal_actions()
-    if not legal:
-        return None
-    return random.choice(legal)
+    return engine.sample_legal_action()
 
 
 def print_action(action: Action):
@@ -77,8 +90,13 @@ def print_action(action: Action):
         print(f"  -> {action.kind} {action.payload}")
 
 
-def main():
-    """Run one hand with random actions."""
+def main(verbose: bool = True):
+    """
+    Run one hand with random actions.
+    
+    With verbose=False the loop only records a binary snapshot per step;
+    the trace is rendered in one write once the hand is over.
+    """
     print("=" * 60)
     print("BestIA Engine Demo - One Hand with Random Actions")
     print("=" * 60)
@@ -90,14 +108,27 @@ def main():
         Player("Charlie", bankroll=1000),
     ]
     
-    # Create engine
-    engine = Engine(players, pot=300, dealer=0, seed=12345)
+    # Create engine; quiet mode skips the GUI pacing pauses
+    engine = Engine(players, pot=300, dealer=0, seed=12345, pacing=2.0 if verbose else 0)
     
     max_steps = 200  # Safety limit
     step_count = 0
     
+    trace = []
+    
     try:
-        while engine.phase != Phase.FINE and step_count < max_steps:
+        while not verbose and engine.phase is not Phase.FINE and step_count < max_steps:
+            trace.append(engine.snapshot_bytes())
+            action = get_random_action(engine)
+            if action is None:
+                print("No legal actions available!")
+                break
+            engine.step(action)
+            step_count += 1
+        if trace:
+            sys.stdout.write(render_trace(trace, players))
+        
+        while engine.phase is not Phase.FINE and step_count < max_steps:
             print_state(engine)
             
             actor = engine.current_actor()
@@ -158,4 +189,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    main(verbose="--quiet" not in sys.argv)
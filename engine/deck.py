@@ -1,5 +1,6 @@
 import random
-from typing import Optional
+from array import array
+from typing import List, Optional
 
 SEEDS = ["Bastoni", "Coppe", "Denari", "Spade"]
 VALUES = ["2", "3", "4", "5", "6", "7", "Fante", "Cavallo", "Re", "Asso"]
@@ -18,25 +19,121 @@ RANK_STRENGTH = {
     "2": 1,
 }
 
+# Values from weakest to strongest: the index is the rank field of a card code
+RANKS = sorted(VALUES, key=RANK_STRENGTH.__getitem__)
+
+# Integer card encoding: suit in the high nibble, rank (briscola order) in the low one
+SUIT_SHIFT = 4
+RANK_MASK = 0xF
+
+SUIT_ID = {seed: i for i, seed in enumerate(SEEDS)}
+RANK_ID = {value: i for i, value in enumerate(RANKS)}
+
+# RANK_STRENGTH indexed by the rank field of a card code instead of by value
+RANK_STRENGTH_T = tuple(RANK_STRENGTH[value] for value in RANKS)
+
+
+def encode_card(seed: str, value: str) -> int:
+    """Encode a (seed, value) pair as a single small int."""
+    return (SUIT_ID[seed] << SUIT_SHIFT) | RANK_ID[value]
+
+
+def card_suit(code: int) -> int:
+    """Suit id (index into SEEDS) of an encoded card."""
+    return code >> SUIT_SHIFT
+
+
+def card_rank(code: int) -> int:
+    """Rank of an encoded card: higher means stronger."""
+    return code & RANK_MASK
+
+
+# Every card of the deck, encoded, in SEEDS x VALUES order
+ALL_CODES = tuple(encode_card(seed, value) for seed in SEEDS for value in VALUES)
+_SORTED_DECK = array("b", ALL_CODES)
+
+# Hands are int bitmasks: bit c is set iff the encoded card c is held
+SUIT_MASKS = tuple(
+    sum(1 << encode_card(seed, value) for value in VALUES) for seed in SEEDS
+)
+
+
+def mask_codes(mask: int) -> List[int]:
+    """Encoded cards of a hand bitmask, in increasing code order."""
+    codes = []
+    while mask:
+        low = mask & -mask
+        codes.append(low.bit_length() - 1)
+        mask ^= low
+    return codes
+
 
 class Card:
-    def __init__(self, seed: str, value: str):
-        self.seed = seed
-        self.value = value
+    """
+    A playing card. There is exactly one Card per (seed, value) pair: the
+    constructor returns the interned instance from ALL_CARDS, so cards
+    compare and hash by identity. Cards are immutable and slotted.
+    """
+    __slots__ = ("seed", "value", "code")
+    
+    def __new__(cls, seed: str, value: str) -> "Card":
+        code = encode_card(seed, value)
+        card = _CARD_BY_CODE[code]
+        if card is None:
+            card = object.__new__(cls)
+            object.__setattr__(card, "seed", SEEDS[code >> SUIT_SHIFT])
+            object.__setattr__(card, "value", RANKS[code & RANK_MASK])
+            object.__setattr__(card, "code", code)
+            _CARD_BY_CODE[code] = card
+        return card
+    
+    def __setattr__(self, name, value):
+        raise AttributeError("Card is immutable")
+    
+    def __delattr__(self, name):
+        raise AttributeError("Card is immutable")
+    
+    @classmethod
+    def from_code(cls, code: int) -> "Card":
+        return _CARD_BY_CODE[code]
+    
+    def __reduce__(self):
+        return (Card, (self.seed, self.value))
 
     def __str__(self):
         return f"{self.value} di {self.seed}"
     
     def __repr__(self):
         return f"Card({self.seed!r}, {self.value!r})"
+
+
+# Interned cards, indexed by code (codes are not contiguous, so holes are None)
+_CARD_BY_CODE: List[Optional[Card]] = [None] * (max(ALL_CODES) + 1)
+ALL_CARDS = tuple(Card(seed, value) for seed in SEEDS for value in VALUES)
+
+
+def compare_codes(lead_suit: Optional[int], briscola_suit: int, a: int, b: int) -> int:
+    """
+    Integer version of compare_cards working on encoded cards and suit ids.
+    Returns: -1 if a < b, 0 if equal, 1 if a > b
+    """
+    a_suit = a >> SUIT_SHIFT
+    b_suit = b >> SUIT_SHIFT
+    a_is_briscola = a_suit == briscola_suit
+    b_is_briscola = b_suit == briscola_suit
     
-    def __eq__(self, other):
-        if not isinstance(other, Card):
-            return False
-        return self.seed == other.seed and self.value == other.value
+    # Briscola always beats non-briscola
+    if a_is_briscola != b_is_briscola:
+        return 1 if a_is_briscola else -1
     
-    def __hash__(self):
-        return hash((self.seed, self.value))
+    # Both non-briscola - must both be of the led suit to compare
+    if not a_is_briscola and (lead_suit is None or a_suit != lead_suit or b_suit != lead_suit):
+        return 0
+    
+    # Same suit: the rank field is already in strength order
+    a_rank = a & RANK_MASK
+    b_rank = b & RANK_MASK
+    return (a_rank > b_rank) - (a_rank < b_rank)
 
 
 def compare_cards(trick_lead_suit: Optional[str], briscola_suit: str, card_a: Card, card_b: Card) -> int:
@@ -49,73 +146,87 @@ def compare_cards(trick_lead_suit: Optional[str], briscola_suit: str, card_a: Ca
     - Among briscolas, highest rank wins
     - Among non-briscolas of the led suit, highest rank wins
     """
-    a_is_briscola = card_a.seed == briscola_suit
-    b_is_briscola = card_b.seed == briscola_suit
-    
-    # Briscola always beats non-briscola
-    if a_is_briscola and not b_is_briscola:
-        return 1
-    if not a_is_briscola and b_is_briscola:
-        return -1
-    
-    # Both briscola or both non-briscola
-    if a_is_briscola and b_is_briscola:
-        # Compare by rank strength
-        strength_a = RANK_STRENGTH[card_a.value]
-        strength_b = RANK_STRENGTH[card_b.value]
-        if strength_a > strength_b:
-            return 1
-        elif strength_a < strength_b:
-            return -1
-        else:
-            return 0
-    
-    # Both non-briscola - must be same suit to compare
-    if trick_lead_suit is None:
-        # No lead suit yet, can't compare meaningfully
-        return 0
-    
-    if card_a.seed != trick_lead_suit or card_b.seed != trick_lead_suit:
-        # Cards not of led suit - shouldn't happen in valid play
-        return 0
-    
-    # Both of led suit, compare by rank
-    strength_a = RANK_STRENGTH[card_a.value]
-    strength_b = RANK_STRENGTH[card_b.value]
-    if strength_a > strength_b:
-        return 1
-    elif strength_a < strength_b:
-        return -1
-    else:
-        return 0
+    lead_suit = SUIT_ID[trick_lead_suit] if trick_lead_suit is not None else None
+    return compare_codes(lead_suit, SUIT_ID[briscola_suit], card_a.code, card_b.code)
 
 
 def get_card_strength(card: Card, briscola_suit: str) -> int:
     """Get absolute strength of a card (for sorting/ordering purposes)."""
-    base_strength = RANK_STRENGTH[card.value]
-    if card.seed == briscola_suit:
+    code = card.code
+    base_strength = RANK_STRENGTH_T[code & RANK_MASK]
+    if code >> SUIT_SHIFT == SUIT_ID[briscola_suit]:
         return base_strength + 100  # Briscolas are always stronger
     return base_strength
 
 
 class Deck:
     def __init__(self, seed: Optional[int] = None):
-        self.cards = [Card(seed, value) for seed in SEEDS for value in VALUES]
-        self._rng = random.Random(seed) if seed is not None else random
+        # Encoded cards packed in a signed-byte buffer (see encode_card).
+        # The buffer is never resized: cards[0..top] are still to be drawn
+        # and the next card to draw is cards[top].
+        self.cards = array("b", ALL_CODES)
+        self.top = len(self.cards) - 1
+        # Private generator: never the module-level one shared by the whole process
+        self._rng = random.Random(seed)
+    
+    def reset(self, seed: Optional[int] = None):
+        """
+        Put every card back in the deck, in sorted order, without reallocating.
+        With a seed, also reseed the shuffle so the next shuffle() deals
+        exactly like a fresh Deck(seed).
+        """
+        if seed is not None:
+            self._rng.seed(seed)
+        self.cards[:] = _SORTED_DECK
+        self.top = len(self.cards) - 1
     
-    def shuffle(self):
-        self._rng.shuffle(self.cards)
+    def shuffle(self, rng: Optional[random.Random] = None):
+        """
+        Shuffle the cards still in the deck (cards[0..top]) in place; drawn
+        cards stay out, only reset() puts them back.
+        rng overrides the deck's own generator, so an owner such as Engine
+        can drive every random draw of a hand from a single seeded stream.
+        """
+        end = self.top + 1
+        undrawn = self.cards[:end]
+        (rng or self._rng).shuffle(undrawn)
+        self.cards[:end] = undrawn
 
-    def draw(self) -> Card:
-        if not self.cards:
+    def draw(self) -> int:
+        """Draw the top card, returned in its encoded form."""
+        top = self.top
+        if top < 0:
             raise RuntimeError("Cannot draw from empty deck")
-        return self.cards.pop()
+        self.top = top - 1
+        return self.cards[top]
+    
+    def draw_many(self, k: int) -> array:
+        """Draw k cards at once, in the same order k calls to draw() would return them."""
+        start = self.top - k + 1
+        if start < 0:
+            raise RuntimeError("Cannot draw from empty deck")
+        drawn = self.cards[start:self.top + 1]
+        drawn.reverse()
+        self.top = start - 1
+        return drawn
     
     def __len__(self):
-        return len(self.cards)
+        return self.top + 1
+    
+    def _undrawn_index(self, index: int) -> int:
+        """Map a list-style index over the undrawn cards to a buffer position."""
+        n = self.top + 1
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("deck index out of range")
+        return index
     
     def __getitem__(self, index):
-        return self.cards[index]
+        # Only cards[0..top] are still in the deck; drawn cards are not exposed
+        if isinstance(index, slice):
+            return self.cards[:self.top + 1][index]
+        return self.cards[self._undrawn_index(index)]
     
     def __setitem__(self, index, value):
-        self.cards[index] = value
+        self.cards[self._undrawn_index(index)] = value
@@ -0,0 +1,130 @@
+"""Integer kernels for the hot paths of trick resolution.
+
+The functions here only take ints and int sequences (encoded cards, see
+deck.encode_card), never Card/Player objects, so they can be driven from
+tight self-play loops without touching Python object attributes.
+"""
+from functools import lru_cache
+from typing import Callable, List, Optional, Sequence
+
+from .deck import ALL_CODES, SEEDS, SUIT_SHIFT, RANK_MASK, SUIT_MASKS
+
+
+def trick_key(card: int, lead_suit: Optional[int], briscola_suit: int) -> int:
+    """Strength of a card inside a trick: briscola > led suit > anything else, then rank."""
+    suit = card >> SUIT_SHIFT
+    if suit == briscola_suit:
+        return 0x20 | (card & RANK_MASK)
+    if suit == lead_suit:
+        return 0x10 | (card & RANK_MASK)
+    return card & RANK_MASK
+
+
+# trick_key precomputed for every card code: TRICK_KEYS[briscola_suit][lead_suit][code].
+# Briscola and led suit are fixed for a whole trick, so the kernels pick their
+# table once and then pay a single tuple index per card.
+_N_CODES = len(SEEDS) << SUIT_SHIFT
+TRICK_KEYS = tuple(
+    tuple(
+        tuple(trick_key(code, lead_suit, briscola_suit) for code in range(_N_CODES))
+        for lead_suit in range(len(SEEDS))
+    )
+    for briscola_suit in range(len(SEEDS))
+)
+
+# BEATS[briscola_suit][lead_suit][code]: bitmask of every card that would
+# take a trick currently won by code (its trick key is strictly higher)
+BEATS = tuple(
+    tuple(
+        tuple(
+            sum(1 << other for other in ALL_CODES if keys[other] > keys[code])
+            for code in range(_N_CODES)
+        )
+        for keys in by_lead
+    )
+    for by_lead in TRICK_KEYS
+)
+
+
+def trick_winner(cards: Sequence[int], n: int, lead_suit: int, briscola_suit: int) -> int:
+    """Index of the winning card among the first n cards of a trick."""
+    keys = TRICK_KEYS[briscola_suit][lead_suit]
+    best_i = 0
+    best_key = keys[cards[0]]
+    for i in range(1, n):
+        key = keys[cards[i]]
+        if key > best_key:
+            best_i = i
+            best_key = key
+    return best_i
+
+
+@lru_cache(maxsize=1 << 16)
+def legal_follow_mask(hand: int, lead_suit: int, briscola_suit: int, winner: int) -> int:
+    """
+    Playable cards of hand when following a trick currently won by winner.
+    Palo first, else briscola, else anything; then "ammazzare sempre": if any
+    of those cards beats the winner, only the beating ones are playable.
+    
+    The result depends only on these four ints, so it is memoized: in search,
+    the same (hand, trick) situations repeat across branches. This trades
+    memory (up to 64k cached entries) for skipping the filtering entirely.
+    """
+    playable = hand & SUIT_MASKS[lead_suit]
+    if not playable:
+        playable = hand & SUIT_MASKS[briscola_suit] or hand
+    return playable & BEATS[briscola_suit][lead_suit][winner] or playable
+
+
+def play_out(hands: List[int], seat: int, tricks_left: int, briscola_suit: int,
+             choose: Callable[[int, int], int], lead_suit: int = -1, in_trick: int = 0,
+             winner_seat: int = -1, winner: int = -1, di_mano_lead: int = -1,
+             log: Optional[list] = None) -> List[int]:
+    """
+    Play the rest of a hand on int state only.
+    
+    hands are the hand masks in turn order (hands[i + 1] plays after
+    hands[i]) and are updated in place; seat plays next. A trick already in
+    progress is described by lead_suit, in_trick (cards played so far) and
+    the current winner_seat/winner card. di_mano_lead, if >= 0, must be led
+    by whoever leads first when they hold it. choose(seat, playable_mask)
+    returns the code to play. Every (seat, code) played is appended to log
+    when given. Returns the number of tricks won per seat.
+    """
+    n = len(hands)
+    won = [0] * n
+    keys_by_lead = TRICK_KEYS[briscola_suit]
+    keys = keys_by_lead[lead_suit] if in_trick else None
+    while tricks_left:
+        hand = hands[seat]
+        if in_trick:
+            playable = legal_follow_mask(hand, lead_suit, briscola_suit, winner)
+        else:
+            playable = hand
+            if di_mano_lead >= 0:
+                if (hand >> di_mano_lead) & 1:
+                    playable = 1 << di_mano_lead
+                di_mano_lead = -1
+        code = choose(seat, playable)
+        if not (playable >> code) & 1:
+            raise ValueError(f"Card code {code} is not playable from mask {playable:#x}")
+        hands[seat] = hand ^ (1 << code)
+        if log is not None:
+            log.append((seat, code))
+        
+        if not in_trick:
+            lead_suit = code >> SUIT_SHIFT
+            keys = keys_by_lead[lead_suit]
+            winner_seat, winner = seat, code
+        elif keys[code] > keys[winner]:
+            winner_seat, winner = seat, code
+        in_trick += 1
+        
+        if in_trick == n:
+            won[winner_seat] += 1
+            tricks_left -= 1
+            in_trick = 0
+            seat = winner_seat
+        else:
+            seat = seat + 1 if seat + 1 < n else 0
+    return won
@@ -1,9 +1,13 @@
-from .deck import Deck, Card, compare_cards, RANK_STRENGTH
+from .deck import ALL_CARDS, Deck, Card, SUIT_ID, SUIT_MASKS, encode_card, mask_codes
+from .kernels import TRICK_KEYS, trick_winner, legal_follow_mask, play_out
 from dataclasses import dataclass, field
-from typing import Optional, Literal, List, Dict, Any
+from typing import Optional, Literal, List, Dict, Any, Tuple, Callable
+from functools import lru_cache
 import logging
 from enum import Enum
+from array import array
 import random
+import struct
 import time
 logger = logging.getLogger(__name__)
 
@@ -25,55 +29,273 @@ class Phase(Enum):
 
 ActorType = Literal["player", "buco"]
 
+# Binary snapshot layout (see Engine.snapshot_bytes), all little-endian:
+# header: phase, pot, dealer, n_players, n_buchi, briscola code, lead suit id,
+#         actor kind, actor id, dealt/decided/cambi/buchi_entry player masks,
+#         completed tricks, current trick length, deck top, deck buffer
+_SNAP_HEADER = struct.Struct("<BiBBBbbBBHHHHBBb40s")
+# per player: hand, bankroll, tricks won, flags (1 = is_playing, 2 = in_buco)
+_SNAP_PLAYER = struct.Struct("<QiBB")
+# per buco: hand, mask of its players, tricks won, discard pending
+_SNAP_BUCO = struct.Struct("<QHB?")
+# per played card (completed tricks first, then the current one): actor kind, actor id, card
+_SNAP_PLAY = struct.Struct("<BBb")
 
-@dataclass(frozen=True)
+_PHASES = tuple(Phase)
+_PHASE_INDEX = {phase: i for i, phase in enumerate(_PHASES)}
+_ACTOR_KINDS = (None, "player", "buco")
+_ACTOR_KIND_INDEX = {"player": 1, "buco": 2}
+
+
+@dataclass(frozen=True, slots=True)
 class Actor:
     """Represents who must act next."""
     kind: ActorType
     id: int  # Player index or Buco index
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Action:
     """Action that can be taken by an actor."""
     kind: str
     payload: Dict[str, Any] = field(default_factory=dict)
 
 
+# Canonical Action instances: legal_actions() hands out these shared objects
+# instead of allocating new ones, so callers must not mutate their payloads
+KEEP = Action("keep", {})
+FOLD = Action("fold", {})
+SERVITO = Action("servito", {})
+TAKE_BUCO = Action("take_buco", {})
+PASS = Action("pass", {})
+CHANGE_CARD = tuple(Action("change_card", {"index": i}) for i in range(3))
+CHANGE_CARDS = {(i, j): Action("change_cards", {"indices": [i, j]}) for i in range(3) for j in range(i + 1, 3)}
+DISCARD = tuple(Action("discard", {"card_index": i}) for i in range(4))
+# Every CAMBI option, in order: change 0 cards, change 1 card, change 2 cards
+_CAMBI_ACTIONS = (SERVITO, *CHANGE_CARD, *(CHANGE_CARDS[i, j] for i in range(3) for j in range(i + 1, 3)))
+PLAY_CARD: List[Optional[Action]] = [None] * (max(card.code for card in ALL_CARDS) + 1)  # by card code
+for _card in ALL_CARDS:
+    PLAY_CARD[_card.code] = Action("play_card", {"card": _card})
+del _card
+
+
+@lru_cache(maxsize=1 << 16)
+def _play_actions(mask: int) -> Tuple[Action, ...]:
+    """
+    Decode a hand bitmask into one play_card action per set bit.
+    Memoized on the mask, so the same Action objects are handed out every
+    time a given set of cards is playable; callers must not mutate them.
+    """
+    actions = []
+    while mask:
+        low = mask & -mask
+        actions.append(PLAY_CARD[low.bit_length() - 1])
+        mask ^= low
+    return tuple(actions)
+
+
+# Packed int actions for the fast path: (kind id << 24) | payload, where the
+# payload is the card index (change_card/discard), i | j << 6 (change_cards)
+# or the encoded card (play_card). See pack_action/unpack_action.
+ACTION_KINDS = ("keep", "fold", "servito", "change_card", "change_cards",
+                "take_buco", "pass", "discard", "play_card")
+ACTION_KIND_ID = {kind: i for i, kind in enumerate(ACTION_KINDS)}
+_ACTION_KIND_SHIFT = 24
+_ACTION_PAYLOAD_MASK = (1 << _ACTION_KIND_SHIFT) - 1
+_PLAY_CARD = ACTION_KIND_ID["play_card"] << _ACTION_KIND_SHIFT
+
+
+def pack_action(action: Action) -> int:
+    """Encode an Action as a single int."""
+    payload = 0
+    if action.kind == "change_card":
+        payload = action.payload["index"]
+    elif action.kind == "change_cards":
+        i, j = action.payload["indices"]
+        payload = i | (j << 6)
+    elif action.kind == "discard":
+        payload = action.payload["card_index"]
+    elif action.kind == "play_card":
+        payload = action.payload["card"].code
+    return (ACTION_KIND_ID[action.kind] << _ACTION_KIND_SHIFT) | payload
+
+
+def unpack_action(packed: int) -> Action:
+    """Decode an int built by pack_action back into an Action."""
+    action = _ACTION_BY_PACKED.get(packed)
+    if action is not None:
+        return action
+    kind = ACTION_KINDS[packed >> _ACTION_KIND_SHIFT]
+    payload = packed & _ACTION_PAYLOAD_MASK
+    if kind == "change_card":
+        return Action(kind, {"index": payload})
+    if kind == "change_cards":
+        return Action(kind, {"indices": [payload & 0x3F, payload >> 6]})
+    if kind == "discard":
+        return Action(kind, {"card_index": payload})
+    if kind == "play_card":
+        return Action(kind, {"card": Card.from_code(payload)})
+    return Action(kind, {})
+
+
+# Every canonical Action by its packed form, so unpacking is one dict lookup
+_ACTION_BY_PACKED = {
+    pack_action(action): action
+    for action in (KEEP, FOLD, SERVITO, TAKE_BUCO, PASS, *CHANGE_CARD,
+                   *CHANGE_CARDS.values(), *DISCARD, *filter(None, PLAY_CARD))
+}
+
+
+# Source of Engine.snapshot(); the players list is unrolled per table size
+_SNAPSHOT_TEMPLATE = """
+def snapshot(engine):
+    gs = engine.gs
+    actor = engine._current_actor
+    briscola = gs.briscola_card
+    __UNPACK__ = gs.players
+    return {
+        "phase": engine.phase.value,
+        "current_actor": {"kind": actor.kind, "id": actor.id} if actor else None,
+        "pot": gs.pot,
+        "dealer": gs.dealer,
+        "briscola_card": CARD_JSON[briscola.code] if briscola else None,
+        "briscola_suit": gs.briscola_suit,
+        "players": [__PLAYERS__],
+        "buchi": [
+            {
+                "buco_id": b.buco_id,
+                "player_names": [p.name for p in b.players],
+                "tricks_won": b.tricks_won,
+                "num_cards": b.hand.bit_count(),
+            }
+            for b in gs.buchi
+        ],
+        "current_trick": [
+            {
+                "actor": {"kind": play_actor.kind, "id": play_actor.id},
+                "card": CARD_JSON[card.code]
+            }
+            for play_actor, card in gs.current_trick
+        ],
+        "tricks_completed": len(gs.tricks),
+    }
+"""
+_PLAYER_SNAPSHOT_TEMPLATE = (
+    '{"name": p.name, "bankroll": p.bankroll, "is_playing": p.is_playing, '
+    '"in_buco": p.in_buco, "tricks_won": p.tricks_won, "num_cards": p.hand.bit_count()}'
+)
+_SNAPSHOT_IMPLS: Dict[int, Any] = {}
+# Snapshot form of every card by code, shared by all snapshots (read-only)
+_CARD_JSON: List[Optional[Dict[str, str]]] = [None] * len(PLAY_CARD)
+for _card in ALL_CARDS:
+    _CARD_JSON[_card.code] = {"seed": _card.seed, "value": _card.value}
+del _card
+
+
+def _snapshot_impl(n_players: int):
+    """
+    Engine.snapshot() for a table of n_players, generated once per size so
+    that every player entry is a straight-line dict literal on a local.
+    """
+    impl = _SNAPSHOT_IMPLS.get(n_players)
+    if impl is None:
+        names = [f"p{i}" for i in range(n_players)]
+        source = (_SNAPSHOT_TEMPLATE
+                  .replace("__UNPACK__", "".join(name + ", " for name in names))
+                  .replace("__PLAYERS__", ", ".join(
+                      _PLAYER_SNAPSHOT_TEMPLATE.replace("p.", name + ".") for name in names)))
+        namespace: Dict[str, Any] = {"CARD_JSON": _CARD_JSON}
+        exec(source, namespace)
+        impl = _SNAPSHOT_IMPLS[n_players] = namespace["snapshot"]
+    return impl
+
+
+@lru_cache(maxsize=1 << 16)
+def _hand_cards(mask: int) -> Tuple[Card, ...]:
+    """Cards of a hand bitmask as a shared read-only tuple, memoized on the mask."""
+    return tuple(Card.from_code(c) for c in mask_codes(mask))
+
+
+def _random_code(mask: int, rng) -> int:
+    """Uniformly random set bit of a non-empty card mask, as a card code."""
+    for _ in range(rng.randrange(mask.bit_count())):
+        mask &= mask - 1  # Drop the lowest set bit
+    return (mask & -mask).bit_length() - 1
+
+
+def _indices_mask(indices) -> int:
+    """Bitmask with bit i set for every index i."""
+    mask = 0
+    for i in indices:
+        mask |= 1 << i
+    return mask
+
+
 class Player:
+    __slots__ = ("name", "hand", "bankroll", "is_playing", "in_buco", "tricks_won")
+    
     def __init__(self, name: str, bankroll: int = 50):
         self.name = name
-        self.cards: List[Card] = []
+        self.hand = 0  # Bitmask of encoded cards held (see deck.encode_card)
         self.bankroll = bankroll
         self.is_playing = False  # Kept their cards
         self.in_buco = False
         self.tricks_won = 0
 
-    def remove_card(self, card: Card):
-        if card in self.cards:
-            self.cards.remove(card)
-        else:
-            raise ValueError(f"Card {card} not found in player {self.name}'s cards")
+    @property
+    def cards(self) -> Tuple[Card, ...]:
+        """Cards in hand, ordered by code (suit, then strength)."""
+        return _hand_cards(self.hand)
+
+    def add_card(self, code: int):
+        self.hand |= 1 << code
+
+    def remove_card(self, code: int):
+        if not (self.hand >> code) & 1:
+            raise ValueError(f"Card {Card.from_code(code)} not found in player {self.name}'s cards")
+        self.hand ^= 1 << code
 
-    def get_cards(self) -> List[Card]:
-        return self.cards.copy()
+    def get_cards(self) -> Tuple[Card, ...]:
+        return self.cards
 
 
 class Buco:
     """Represents a Buco/Bambino entity (can be società)."""
+    __slots__ = ("players", "hand", "buco_id", "tricks_won", "discard_pending")
+    
     def __init__(self, players: List[Player], buco_id: int):
         self.players = players
-        self.cards: List[Card] = []
+        self.hand = 0  # Bitmask of encoded cards held (see deck.encode_card)
         self.buco_id = buco_id
         self.tricks_won = 0
         self.discard_pending = False  # True when waiting for discard decision
 
-    def add_card(self, card: Card):
-        self.cards.append(card)
+    @property
+    def cards(self) -> Tuple[Card, ...]:
+        """Cards in hand, ordered by code (suit, then strength)."""
+        return _hand_cards(self.hand)
+
+    def add_card(self, code: int):
+        self.hand |= 1 << code
+
+    def remove_card(self, code: int):
+        if not (self.hand >> code) & 1:
+            raise ValueError(f"Card {Card.from_code(code)} not found in buco {self.buco_id}'s cards")
+        self.hand ^= 1 << code
 
 
 class GameState:
     """Internal game state (not directly exposed to GUI)."""
+    __slots__ = (
+        "deck", "players", "n_players", "pot", "dealer",
+        "briscola_card", "briscola_suit", "briscola_suit_id", "briscola_mask",
+        "di_mano_lead", "di_mano_pending",
+        "playing_players", "buchi", "tricks", "current_trick",
+        "trick_cards", "trick_len", "trick_lead_suit", "trick_lead_suit_id", "trick_winner",
+        "turn_ring", "turn_index", "n_active",
+        "dealt_mask", "decisions", "cambi_mask", "buchi_entry_mask", "next_buco_id",
+    )
+    
     def __init__(self, deck: Deck, players: List[Player], pot: int = 0, dealer: int = 0):
         self.deck = deck
         self.players = players
@@ -82,24 +304,184 @@ class GameState:
         self.dealer = dealer
         self.briscola_card: Optional[Card] = None  # "carta in mezzo"
         self.briscola_suit: Optional[str] = None
+        # Per-hand integer views of the briscola, set once it is drawn
+        self.briscola_suit_id: Optional[int] = None
+        self.briscola_mask = 0  # SUIT_MASKS entry of the briscola suit
+        # Card that must be led "di mano" if held: the Asso of briscola, or the
+        # 3 when the Asso itself is the carta in mezzo
+        self.di_mano_lead: Optional[int] = None
+        self.di_mano_pending = True  # No card of the PLAY phase played yet
         
         self.playing_players: List[Player] = []  # Players who kept
         self.buchi: List[Buco] = []
         self.tricks: List[List[tuple]] = []  # Each trick is list of (actor, card)
         self.current_trick: List[tuple] = []
+        # Encoded cards of current_trick in a fixed buffer (at most one per
+        # player), filled up to trick_len: fed to the trick kernels as-is
+        self.trick_cards = array("b", bytes(self.n_players))
+        self.trick_len = 0
         self.trick_lead_suit: Optional[str] = None
+        self.trick_lead_suit_id: Optional[int] = None
         self.trick_winner: Optional[tuple] = None  # (Actor, card)
         
+        # Play order, fixed once folds and buchi are settled (see build_turn_ring)
+        self.turn_ring: List[Actor] = []
+        self.turn_index: Dict[Actor, int] = {}  # Actor -> position in turn_ring
+        self.n_active = 0  # len(turn_ring): cards in a complete trick
+        
         # Deal tracking
-        self.dealt_to: List[int] = []  # Player indices who received cards
+        self.dealt_mask = 0  # Bit i is set once player i received cards
         self.decisions: Dict[int, bool] = {}  # Player index -> kept (True) or folded (False)
         
         # Cambi tracking
-        self.cambi_done: List[int] = []  # Player indices who already changed their cards
+        self.cambi_mask = 0  # Bit i is set once player i changed their cards
         
         # Buco tracking
-        self.buchi_entry_done: List[int] = []  # Player indices who decided on buco entry
+        self.buchi_entry_mask = 0  # Bit i is set once player i decided on buco entry
         self.next_buco_id = 0
+    
+    def reset(self, pot: int = 0, dealer: int = 0):
+        """Clear all per-hand state in place for a new hand; deck and bankrolls are kept."""
+        for p in self.players:
+            p.hand = 0
+            p.is_playing = False
+            p.in_buco = False
+            p.tricks_won = 0
+        self.pot = pot
+        self.dealer = dealer
+        self.set_briscola(None)
+        self.di_mano_pending = True
+        
+        self.playing_players.clear()
+        self.buchi.clear()
+        self.tricks.clear()
+        self.current_trick = []  # May still be the last entry of the previous hand's tricks
+        self.trick_len = 0
+        self.trick_lead_suit = None
+        self.trick_lead_suit_id = None
+        self.trick_winner = None
+        self.turn_ring.clear()
+        self.turn_index.clear()
+        self.n_active = 0
+        
+        self.dealt_mask = 0
+        self.decisions.clear()
+        self.cambi_mask = 0
+        self.buchi_entry_mask = 0
+        self.next_buco_id = 0
+    
+    def set_briscola(self, card: Optional[Card]):
+        """Set the carta in mezzo and every per-hand value derived from it."""
+        self.briscola_card = card
+        if card is None:
+            self.briscola_suit = None
+            self.briscola_suit_id = None
+            self.briscola_mask = 0
+            self.di_mano_lead = None
+            return
+        self.briscola_suit = card.seed
+        self.briscola_suit_id = SUIT_ID[card.seed]
+        self.briscola_mask = SUIT_MASKS[self.briscola_suit_id]
+        self.di_mano_lead = encode_card(card.seed, "3" if card.value == "Asso" else "Asso")
+    
+    def build_turn_ring(self):
+        """Active participants counter-clockwise from the dealer's right: kept players and buchi."""
+        # A buco takes the seat of its first player
+        buco_seats = {id(buco.players[0]): i for i, buco in enumerate(self.buchi) if buco.players}
+        ring = []
+        start_idx = (self.dealer + 1) % self.n_players
+        for offset in range(self.n_players):
+            idx = (start_idx + offset) % self.n_players
+            player = self.players[idx]
+            if player.is_playing:
+                ring.append(Actor("player", idx))
+            elif player.in_buco and id(player) in buco_seats:
+                ring.append(Actor("buco", buco_seats[id(player)]))
+        self.turn_ring = ring
+        self.turn_index = {actor: i for i, actor in enumerate(ring)}
+        self.n_active = len(ring)
+    
+    def load_trick_buffer(self):
+        """Refill trick_cards/trick_len from current_trick."""
+        for i, (_, card) in enumerate(self.current_trick):
+            self.trick_cards[i] = card.code
+        self.trick_len = len(self.current_trick)
+    
+    def __getstate__(self):
+        """
+        Compact pickle state: the deck buffer and per-player fields travel as
+        packed byte strings instead of Deck/Player/Card object graphs.
+        Pickle with protocol 5 (pickle.HIGHEST_PROTOCOL) so these payloads are
+        written as raw binary frames.
+        """
+        players = self.players
+        index = {id(p): i for i, p in enumerate(players)}
+        
+        def plays(trick):
+            return [(actor.kind, actor.id, card.code) for actor, card in trick]
+        
+        return (
+            self.pot, self.dealer, self.next_buco_id,
+            self.briscola_card.code if self.briscola_card else -1,
+            self.trick_lead_suit_id,
+            self.deck.cards.tobytes(), self.deck.top,
+            [p.name for p in players],
+            array("Q", [p.hand for p in players]).tobytes(),
+            array("q", [p.bankroll for p in players]).tobytes(),
+            bytes(p.tricks_won for p in players),
+            bytes(p.is_playing | (p.in_buco << 1) for p in players),
+            [index[id(p)] for p in self.playing_players],
+            [(b.hand, [index[id(p)] for p in b.players], b.tricks_won, b.discard_pending)
+             for b in self.buchi],
+            [plays(trick) for trick in self.tricks],
+            plays(self.current_trick),
+            self.current_trick.index(self.trick_winner) if self.trick_winner else -1,
+            self.dealt_mask, self.decisions, self.cambi_mask, self.buchi_entry_mask,
+        )
+    
+    def __setstate__(self, state):
+        (pot, dealer, next_buco_id, briscola, lead_suit_id, deck_bytes, deck_top,
+         names, hands, bankrolls, tricks_won, flags, playing, buchi, tricks, current_trick,
+         winner_idx, dealt_mask, decisions, cambi_mask, buchi_entry_mask) = state
+        
+        deck = Deck()
+        deck.cards[:] = array("b", deck_bytes)
+        deck.top = deck_top
+        players = [Player(name, bankroll) for name, bankroll in zip(names, array("q", bankrolls))]
+        for p, hand, won, flag in zip(players, array("Q", hands), tricks_won, flags):
+            p.hand = hand
+            p.tricks_won = won
+            p.is_playing = bool(flag & 1)
+            p.in_buco = bool(flag & 2)
+        self.__init__(deck, players, pot, dealer)
+        
+        self.set_briscola(Card.from_code(briscola) if briscola >= 0 else None)
+        
+        self.playing_players = [players[i] for i in playing]
+        for buco_id, (hand, member_idx, won, pending) in enumerate(buchi):
+            buco = Buco([players[i] for i in member_idx], buco_id)
+            buco.hand = hand
+            buco.tricks_won = won
+            buco.discard_pending = pending
+            self.buchi.append(buco)
+        self.next_buco_id = next_buco_id
+        
+        def unplays(trick):
+            return [(Actor(kind, actor_id), Card.from_code(code)) for kind, actor_id, code in trick]
+        
+        self.tricks = [unplays(trick) for trick in tricks]
+        self.current_trick = unplays(current_trick)
+        self.load_trick_buffer()
+        self.trick_lead_suit_id = lead_suit_id
+        self.trick_lead_suit = self.current_trick[0][1].seed if self.current_trick else None
+        self.trick_winner = self.current_trick[winner_idx] if winner_idx >= 0 else None
+        self.di_mano_pending = not self.tricks and not self.current_trick
+        
+        self.dealt_mask = dealt_mask
+        self.decisions = decisions
+        self.cambi_mask = cambi_mask
+        self.buchi_entry_mask = buchi_entry_mask
+        self.build_turn_ring()
 
 
 class Engine:
@@ -109,221 +491,395 @@ class Engine:
     through automatic transitions until next player decision is required.
     """
     
-    def __init__(self, players: List[Player], pot: int = 0, dealer: int = 0, seed: Optional[int] = None):
-        self.rng = random.Random(seed) if seed is not None else random
-        deck = Deck(seed=seed if seed is not None else None)
-        deck.shuffle()
+    def __init__(self, players: List[Player], pot: int = 0, dealer: int = 0, seed: Optional[int] = None,
+                 pacing: float = 2.0):
+        # Seconds to pause on keep/buco/play steps so a GUI table can follow;
+        # 0 for headless runs (benchmarks, simulations)
+        self.pacing = pacing
+        # One generator per engine drives the shuffle; the global random module is never touched
+        self.rng = random.Random(seed)
+        deck = Deck()
+        deck.shuffle(self.rng)
         
         self.gs = GameState(deck, players, pot, dealer)
+        self._snapshot_impl = _snapshot_impl(len(players))
+        # Bumped by every engine transition; keys the snapshot()/legal_actions() caches
+        self.state_version = 0
+        self._snapshot_cache: Optional[Tuple[int, GameState, Dict[str, Any]]] = None
+        self._legal_cache: Optional[Tuple[int, GameState, Tuple[Action, ...]]] = None
         self.phase = Phase.DEAL_DECIDE
         self._current_actor: Optional[Actor] = None
         
+        # Phase -> handler jump tables for step(), legal_actions() and _run_to_next_decision()
+        self._step_dispatch = {
+            Phase.DEAL_DECIDE: self._step_deal_decide,
+            Phase.CAMBI: self._step_cambi,
+            Phase.BUCHI_ENTRY: self._step_buchi_entry,
+            Phase.BUCHI_DISCARD: self._step_buchi_discard,
+            Phase.PLAY: self._step_play,
+        }
+        self._advance_dispatch = {
+            Phase.DEAL_DECIDE: self._advance_deal_decide,
+            Phase.CAMBI: self._advance_cambi,
+            Phase.BUCHI_ENTRY: self._advance_buchi_entry,
+            Phase.BUCHI_DISCARD: self._advance_buchi_discard,
+            Phase.PLAY: self._advance_play,
+            Phase.SETTLE: self._advance_settle,
+            Phase.FINE: self._advance_fine,
+        }
+        self._legal_dispatch = {
+            Phase.DEAL_DECIDE: self._legal_deal_decide,
+            Phase.CAMBI: self._legal_cambi,
+            Phase.BUCHI_ENTRY: self._legal_buchi_entry,
+            Phase.BUCHI_DISCARD: self._legal_buchi_discard,
+            Phase.PLAY: self._legal_play,
+        }
+        
         # Initialize: draw briscola card
-        self.gs.briscola_card = self.gs.deck.draw()
-        self.gs.briscola_suit = self.gs.briscola_card.seed
+        self._draw_briscola()
         
         # Start first decision
         self._run_to_next_decision()
     
+    def reset(self, pot: int = 0, dealer: int = 0, seed: Optional[int] = None):
+        """
+        Start a new hand on this engine, reusing its deck, game state and
+        player objects (bankrolls carry over). Deals exactly like a new
+        Engine(players, pot, dealer, seed) would, without allocating one.
+        """
+        if seed is not None:
+            self.rng.seed(seed)
+        self.gs.reset(pot, dealer)
+        self.gs.deck.reset()
+        self.gs.deck.shuffle(self.rng)
+        self.phase = Phase.DEAL_DECIDE
+        self._current_actor = None
+        
+        self._draw_briscola()
+        self._run_to_next_decision()
+    
+    def _draw_briscola(self):
+        self.gs.set_briscola(Card.from_code(self.gs.deck.draw()))
+    
     def current_actor(self) -> Optional[Actor]:
         """Return the actor who must act next, or None if no decision needed."""
         return self._current_actor
     
+    def has_current_actor(self) -> bool:
+        """True if a decision is pending."""
+        return self._current_actor is not None
+    
     def legal_actions(self) -> List[Action]:
-        """Return list of legal actions for current actor."""
-        if self._current_actor is None:
-            return []
+        """
+        Return list of legal actions for current actor.
         
-        actor = self._current_actor
-        
-        if self.phase == Phase.DEAL_DECIDE:
-            if actor.kind == "player":
-                logger.info(f"Legal actions for player {actor.id} in DEAL_DECIDE phase: Keep/Fold")
-                return [
-                    Action("keep", {}),
-                    Action("fold", {})
-                ]
-        
-        elif self.phase == Phase.CAMBI:
-            if actor.kind == "player":
-                player = self.gs.players[actor.id]
-                actions = [Action("servito", {})]  # Change 0 cards
-                # Change 1 card
-                for i in range(3):
-                    actions.append(Action("change_card", {"index": i}))
-                # Change 2 cards
-                for i in range(3):
-                    for j in range(i + 1, 3):
-                        actions.append(Action("change_cards", {"indices": [i, j]}))
-                logger.info(f"Legal actions for player {actor.id} in CAMBI phase: {actions}")
-                return actions
-        
-        elif self.phase == Phase.BUCHI_ENTRY:
-            if actor.kind == "player":
-                player = self.gs.players[actor.id]
-                if not player.is_playing:  # Only discarders can take buco
-                    logger.info(f"Legal actions for player {actor.id} in BUCHI_ENTRY phase: take_buco/pass")
-                    return [
-                        Action("take_buco", {}),
-                        Action("pass", {})
-                    ]
-        
-        elif self.phase == Phase.BUCHI_DISCARD:
-            if actor.kind == "buco":
-                buco = self.gs.buchi[actor.id]
-                if len(buco.cards) == 4:
-                    # Discard one of the 4 cards
-                    logger.info(f"Legal actions for buco {actor.id} in BUCHI_DISCARD phase: discard one of 4 cards")
-                    return [
-                        Action("discard", {"card_index": i})
-                        for i in range(4)
-                    ]
-        
-        elif self.phase == Phase.PLAY:
-            if actor.kind == "player":
-                player = self.gs.players[actor.id]
-                return self._legal_play_actions(player)
-            elif actor.kind == "buco":
-                buco = self.gs.buchi[actor.id]
-                # Buco plays like a player (use first player in buco for card access)
-                if buco.players:
-                    return self._legal_play_actions_for_cards(buco.cards, buco.players[0])
-        
-        elif self.phase == Phase.SETTLE:
-            return []  # Automatic
+        Computed once per decision point (cached like snapshot(), on
+        state_version); each call returns a fresh list, so callers may
+        mutate it freely.
+        """
+        return list(self._cached_legal_actions())
+    
+    def _cached_legal_actions(self) -> Tuple[Action, ...]:
+        """Legal actions of the current decision point, as the cached read-only tuple."""
+        cache = self._legal_cache
+        if cache is not None and cache[0] == self.state_version and cache[1] is self.gs:
+            return cache[2]
         
+        handler = self._legal_dispatch.get(self.phase)
+        if self._current_actor is None or handler is None:
+            legal = ()  # SETTLE/FINE are automatic
+        else:
+            legal = tuple(handler(self._current_actor))
+        self._legal_cache = (self.state_version, self.gs, legal)
+        return legal
+    
+    def _legal_deal_decide(self, actor: Actor) -> List[Action]:
+        if actor.kind == "player":
+            logger.info(f"Legal actions for player {actor.id} in DEAL_DECIDE phase: Keep/Fold")
+            return [KEEP, FOLD]
+        return []
+    
+    def _legal_cambi(self, actor: Actor) -> List[Action]:
+        if actor.kind == "player":
+            actions = list(_CAMBI_ACTIONS)
+            logger.info(f"Legal actions for player {actor.id} in CAMBI phase: {actions}")
+            return actions
+        return []
+    
+    def _legal_buchi_entry(self, actor: Actor) -> List[Action]:
+        if actor.kind == "player":
+            player = self.gs.players[actor.id]
+            if not player.is_playing:  # Only discarders can take buco
+                logger.info(f"Legal actions for player {actor.id} in BUCHI_ENTRY phase: take_buco/pass")
+                return [TAKE_BUCO, PASS]
+        return []
+    
+    def _legal_buchi_discard(self, actor: Actor) -> List[Action]:
+        if actor.kind == "buco":
+            buco = self.gs.buchi[actor.id]
+            if buco.hand.bit_count() == 4:
+                # Discard one of the 4 cards
+                logger.info(f"Legal actions for buco {actor.id} in BUCHI_DISCARD phase: discard one of 4 cards")
+                return list(DISCARD)
+        return []
+    
+    def _legal_play(self, actor: Actor) -> List[Action]:
+        if actor.kind == "player":
+            player = self.gs.players[actor.id]
+            return self._legal_play_actions(player)
+        elif actor.kind == "buco":
+            buco = self.gs.buchi[actor.id]
+            # Buco plays like a player (use first player in buco for card access)
+            if buco.players:
+                return self._legal_play_actions_for_hand(buco.hand, buco.players[0])
         return []
     
     def _legal_play_actions(self, player: Player) -> List[Action]:
         """Get legal play actions for a player, considering palo/briscola/ammazzare rules."""
         logger.info(f"Getting legal play actions for player {player.name} with cards: {player.cards}")
-        return self._legal_play_actions_for_cards(player.cards, player)
+        return self._legal_play_actions_for_hand(player.hand, player)
+    
+    def _legal_play_actions_for_hand(self, hand: int, player: Player) -> List[Action]:
+        """Helper to get legal actions given a hand bitmask."""
+        return list(_play_actions(self._legal_play_mask(hand, player)))
     
-    def _legal_play_actions_for_cards(self, cards: List[Card], player: Player) -> List[Action]:
-        """Helper to get legal actions given a hand of cards."""
-        if not cards:
-            return []
+    def _legal_play_mask(self, hand: int, player: Player) -> int:
+        """Bitmask of the cards of hand that can legally be played now."""
+        if not hand:
+            return 0
         
         # If leading the trick
         if len(self.gs.current_trick) == 0:
-            legal = []
             # Check "di mano" obligations
-            must_play = self._get_mandatory_lead(player, cards)
-            if must_play:
-                return [Action("play_card", {"card": must_play})]
+            must_play = self._get_mandatory_lead(player, hand)
+            if must_play is not None:
+                return 1 << must_play
             
             # Can play any card when leading
-            for card in cards:
-                legal.append(Action("play_card", {"card": card}))
-            return legal
-        
-        # Not leading - must follow rules
-        lead_suit = self.gs.trick_lead_suit
-        briscola_suit = self.gs.briscola_suit
-        
-        # Find cards that can be played
-        can_play = []
-        must_play = []
-        
-        # Check if can follow suit
-        suit_cards = [c for c in cards if c.seed == lead_suit]
-        briscola_cards = [c for c in cards if c.seed == briscola_suit]
-        
-        if self.gs.trick_winner and suit_cards:
-            # Must follow suit
-            must_play = suit_cards
-        elif self.gs.trick_winner and briscola_cards:
-            # Must play briscola
-            can_play = briscola_cards
-        else:
-            # Can play any card
-            can_play = cards
-        
-        # Now check "ammazzare sempre" - must beat current winner if possible
-        if self.gs.trick_winner:
-            winning_card = self.gs.trick_winner[1]
-            logger.info(f"Current winning card in trick: {winning_card}")
-            if must_play:
-                beating_cards = [
-                    c for c in must_play
-                    if compare_cards(lead_suit, briscola_suit, c, winning_card) > 0
-                ]
-                logger.info(f"Beating cards from must_play: {beating_cards}")
-                if beating_cards:
-                    # Must play a card that beats
-                    must_play = beating_cards
-            else:
-                beating_cards = [
-                    c for c in can_play
-                    if compare_cards(lead_suit, briscola_suit, c, winning_card) > 0
-                ]
-                logger.info(f"Beating cards from can_play: {beating_cards}")
-                if beating_cards:
-                    # Must play a card that beats
-                    must_play = beating_cards
-                else:
-                    must_play = can_play
-        logger.info(f"Legal play actions for player {player.name}: must_play={must_play}")
-        return [Action("play_card", {"card": card}) for card in must_play]
+            return hand
+        
+        # Not leading - must follow palo/briscola and "ammazzare sempre" rules
+        playable = legal_follow_mask(hand, self.gs.trick_lead_suit_id, self.gs.briscola_suit_id,
+                                     self.gs.trick_winner[1].code)
+        logger.info(f"Legal play actions for player {player.name}: must_play={mask_codes(playable)}")
+        return playable
     
-    def _get_mandatory_lead(self, player: Player, cards: List[Card]) -> Optional[Card]:
-        """Check 'di mano' obligations when leading."""
-        briscola_suit = self.gs.briscola_suit
+    def _current_play_mask(self) -> int:
+        """Legal play mask of the current PLAY actor (player or buco)."""
+        actor = self._current_actor
+        if actor.kind == "player":
+            player = self.gs.players[actor.id]
+            return self._legal_play_mask(player.hand, player)
+        buco = self.gs.buchi[actor.id]
+        return self._legal_play_mask(buco.hand, buco.players[0]) if buco.players else 0
+    
+    def sample_legal_action(self, rng: Optional[random.Random] = None) -> Optional[Action]:
+        """
+        Pick one legal action uniformly at random, with rng or by default
+        the engine's own seeded generator.
+        In the play phase only the chosen card is decoded, without building
+        the full legal action list.
+        """
+        rng = rng or self.rng
+        actor = self._current_actor
+        if actor is None:
+            return None
+        if self.phase is Phase.PLAY:
+            mask = self._current_play_mask()
+            if not mask:
+                return None
+            return PLAY_CARD[_random_code(mask, rng)]
+        legal = self._cached_legal_actions()
+        return legal[rng.randrange(len(legal))] if legal else None
+    
+    def play_out(self, choose: Optional[Callable[[int, int], int]] = None,
+                 rng: Optional[random.Random] = None) -> None:
+        """
+        Finish the PLAY phase on int state through kernels.play_out, without
+        step()/Action objects per card, then settle as usual.
         
-        # Check if this is the first card of the play phase (di mano)
-        # Di mano = first trick of play phase, first card
-        is_di_mano = (
-            len(self.gs.tricks) == 0 and
-            len(self.gs.current_trick) == 0
-        )
+        choose(seat, playable_mask) returns the card code to play, where seat
+        indexes gs.turn_ring; by default a uniformly random legal card is
+        picked with rng (default: the engine's own generator). The outcome is written back (hands, tricks,
+        tricks_won) so the finished hand looks the same as one played
+        through step().
+        """
+        if self.phase is not Phase.PLAY or self._current_actor is None:
+            raise RuntimeError("play_out() needs a pending PLAY decision")
+        gs = self.gs
+        ring = gs.turn_ring
+        entities = [gs.players[a.id] if a.kind == "player" else gs.buchi[a.id] for a in ring]
+        hands = [entity.hand for entity in entities]
+        if choose is None:
+            rng = rng or self.rng
+            choose = lambda seat, mask: _random_code(mask, rng)
         
-        if not is_di_mano:
-            return None
+        in_trick = gs.trick_len
+        winner_seat = gs.turn_index[gs.trick_winner[0]] if in_trick else -1
+        winner = gs.trick_winner[1].code if in_trick else -1
+        di_mano_lead = gs.di_mano_lead if gs.di_mano_pending and gs.di_mano_lead is not None else -1
+        log = []
+        won = play_out(hands, gs.turn_index[self._current_actor], 3 - len(gs.tricks),
+                       gs.briscola_suit_id, choose,
+                       lead_suit=gs.trick_lead_suit_id if in_trick else -1, in_trick=in_trick,
+                       winner_seat=winner_seat, winner=winner, di_mano_lead=di_mano_lead, log=log)
+        
+        for entity, hand, n_won in zip(entities, hands, won):
+            entity.hand = hand
+            entity.tricks_won += n_won
+        # Rebuild the trick records; the last trick stays in current_trick as after step()
+        n = len(ring)
+        trick = gs.current_trick
+        for seat, code in log:
+            trick.append((ring[seat], Card.from_code(code)))
+            if len(trick) == n:
+                gs.tricks.append(trick)
+                if len(gs.tricks) < 3:
+                    trick = []
+        gs.current_trick = trick
+        gs.load_trick_buffer()
+        gs.trick_lead_suit = trick[0][1].seed
+        gs.trick_lead_suit_id = SUIT_ID[gs.trick_lead_suit]
+        gs.di_mano_pending = False
+        self._update_trick_winner()
+        
+        self.phase = Phase.SETTLE
+        self._current_actor = None
+        self._run_to_next_decision()
+    
+    def rollout(self, decide_keep: Callable[[int, int], bool], decide_cambi: Callable[[int, int], int],
+                decide_play: Callable[[int, int], int]) -> Dict[Actor, int]:
+        """
+        Play a freshly dealt hand to the end on int state, for Monte Carlo
+        rollouts and self-play, without Action objects or legal_actions().
         
-        # Rule: If leading (di mano) and you have Asso of Briscola, you must play it
-        asso_briscola = next((c for c in cards if c.seed == briscola_suit and c.value == "Asso"), None)
-        if asso_briscola:
-            return asso_briscola
+        decide_keep(player_idx, hand_mask) returns whether the player keeps;
+        decide_cambi(player_idx, hand_mask) returns the mask of cards to
+        change (at most 2, 0 for servito); decide_play is the choose callback
+        of play_out(). Discarders always pass on the buchi: hands with buchi
+        still go through step(). Automatic transitions and settlement run
+        as usual, so the engine ends in FINE as after step().
         
-        # Rule: If briscola card in middle is Asso and di mano and you have 3 of briscola, must lead 3
-        if self.gs.briscola_card and self.gs.briscola_card.value == "Asso":
-            tre_briscola = next((c for c in cards if c.seed == briscola_suit and c.value == "3"), None)
-            if tre_briscola:
-                return tre_briscola
+        Returns the tricks won by each participant of the play phase. Raises
+        ValueError if every player folds, since nobody would be left to play.
+        """
+        if self.phase is not Phase.DEAL_DECIDE:
+            raise RuntimeError("rollout() needs a freshly dealt hand")
+        gs = self.gs
+        players = gs.players
         
+        while self.phase is Phase.DEAL_DECIDE:
+            idx = self._current_actor.id
+            player = players[idx]
+            keep = bool(decide_keep(idx, player.hand))
+            if keep:
+                player.is_playing = True
+                gs.playing_players.append(player)
+            gs.decisions[idx] = keep
+            self._run_to_next_decision()
+        
+        if not gs.playing_players:
+            # Nobody would reach the play phase: discarders pass on the buchi
+            # here. The engine is left at this decision point for step().
+            raise ValueError("rollout() needs at least one player to keep")
+        
+        while self.phase is Phase.CAMBI:
+            idx = self._current_actor.id
+            player = players[idx]
+            change = decide_cambi(idx, player.hand) & player.hand
+            if change.bit_count() > 2:
+                raise ValueError(f"Player {player.name} cannot change more than 2 cards")
+            if change:
+                player.hand ^= change
+                for code in gs.deck.draw_many(change.bit_count()):
+                    player.hand |= 1 << code
+            gs.cambi_mask |= 1 << idx
+            self._run_to_next_decision()
+        
+        while self.phase is Phase.BUCHI_ENTRY:
+            gs.buchi_entry_mask |= 1 << self._current_actor.id
+            self._run_to_next_decision()
+        
+        ring = gs.turn_ring
+        self.play_out(decide_play)
+        return {actor: (players[actor.id] if actor.kind == "player" else gs.buchi[actor.id]).tricks_won
+                for actor in ring}
+    
+    def _get_mandatory_lead(self, player: Player, hand: int) -> Optional[int]:
+        """Check 'di mano' obligations when leading."""
+        # Di mano = first trick of play phase, first card
+        if not self.gs.di_mano_pending:
+            return None
+        
+        # Rule: If leading (di mano) and you have Asso of Briscola, you must play it.
+        # If the briscola card in middle is the Asso, the 3 of briscola must be led instead.
+        must_lead = self.gs.di_mano_lead
+        if must_lead is not None and (hand >> must_lead) & 1:
+            return must_lead
         return None
     
-    def step(self, action: Action) -> None:
-        """Apply an action and run to next decision point."""
+    def step(self, action: Action, validate: bool = True) -> None:
+        """
+        Apply an action and run to next decision point.
+        
+        Trusted callers that only pick from legal_actions() (self-play,
+        search) can pass validate=False to skip the legality check.
+        """
         if self._current_actor is None:
             raise RuntimeError("No current actor - cannot step")
         
-        legal = self.legal_actions()
-        if action not in legal:
-            raise ValueError(f"Action {action} is not legal. Legal actions: {legal}")
-        
-        # Apply action based on phase
-        if self.phase == Phase.DEAL_DECIDE:
-            self._step_deal_decide(action)
-        elif self.phase == Phase.CAMBI:
-            self._step_cambi(action)
-        elif self.phase == Phase.BUCHI_ENTRY:
-            self._step_buchi_entry(action)
-        elif self.phase == Phase.BUCHI_DISCARD:
-            self._step_buchi_discard(action)
-        elif self.phase == Phase.PLAY:
-            self._step_play(action)
-        elif self.phase == Phase.SETTLE:
-            # Should not happen - settle is automatic
-            pass
+        if validate and not self._is_legal(action):
+            raise ValueError(f"Action {action} is not legal. Legal actions: {self.legal_actions()}")
+        
+        self._apply(action)
+    
+    def _is_legal(self, action: Action) -> bool:
+        """
+        Legality check for step(). In the play phase this is a single bit
+        test on the legal play mask instead of building the Action list.
+        """
+        if self.phase is Phase.PLAY:
+            if action.kind != "play_card":
+                return False
+            card = action.payload.get("card")
+            return isinstance(card, Card) and bool((self._current_play_mask() >> card.code) & 1)
+        return action in self._cached_legal_actions()
+    
+    def legal_actions_int(self) -> List[int]:
+        """Legal actions packed as ints (see pack_action), for RL/search callers."""
+        if self.phase is Phase.PLAY and self._current_actor is not None:
+            return [_PLAY_CARD | code for code in mask_codes(self._current_play_mask())]
+        return [pack_action(action) for action in self._cached_legal_actions()]
+    
+    def step_int(self, action: int, validate: bool = True) -> None:
+        """step() for an action packed as an int by pack_action."""
+        if self._current_actor is None:
+            raise RuntimeError("No current actor - cannot step")
+        
+        if validate and action not in self.legal_actions_int():
+            raise ValueError(f"Action {unpack_action(action)} is not legal")
+        
+        self._apply(unpack_action(action))
+    
+    def _apply(self, action: Action) -> None:
+        """Apply an already validated action and run to next decision point."""
+        self.state_version += 1
+        # Apply action based on phase (SETTLE/FINE are automatic and have no handler)
+        handler = self._step_dispatch.get(self.phase)
+        if handler is not None:
+            handler(action)
         
         # Run to next decision
         self._run_to_next_decision()
     
+    def _pace(self):
+        if self.pacing:
+            time.sleep(self.pacing)
+    
     def _step_deal_decide(self, action: Action):
         """Handle Keep/Fold decision."""
         logger.info(f"Player {self._current_actor.id} action in DEAL_DECIDE: {action}")
-        time.sleep(2)
+        self._pace()
         if action.kind == "keep":
             logger.info(f"Player {self._current_actor.id} chose to KEEP their cards.")
             player_idx = self._current_actor.id
@@ -347,31 +903,29 @@ class Engine:
             pass
         elif action.kind == "change_card":
             idx = action.payload["index"]
-            old_card = player.cards[idx]
+            old_card = mask_codes(player.hand)[idx]
             player.remove_card(old_card)
             new_card = self.gs.deck.draw()
-            logger.info(f"Player {player_idx} changed card at index {idx} from {old_card} to {new_card}.")
-            player.cards.insert(idx, new_card)
+            logger.info(f"Player {player_idx} changed card at index {idx} from {Card.from_code(old_card)} to {Card.from_code(new_card)}.")
+            player.add_card(new_card)
         elif action.kind == "change_cards":
-            indices = sorted(action.payload["indices"], reverse=True)  # Remove from high to low
-            for idx in indices:
-                old_card = player.cards[idx]
-                player.remove_card(old_card)
-                logger.info(f"Player {player_idx} changed card at index {idx} from {old_card}.")
-            # Add new cards in order
-            for idx in sorted(action.payload["indices"]):
-                new_card = self.gs.deck.draw()
-                player.cards.insert(idx, new_card)
-                logger.info(f"Player {player_idx} received new card {new_card} at index {idx}.")
-        
-        self.gs.cambi_done.append(player_idx)
+            # Indices refer to the hand before any card is removed
+            hand_codes = mask_codes(player.hand)
+            for idx in action.payload["indices"]:
+                player.remove_card(hand_codes[idx])
+                logger.info(f"Player {player_idx} changed card at index {idx} from {Card.from_code(hand_codes[idx])}.")
+            for new_card in self.gs.deck.draw_many(len(action.payload["indices"])):
+                player.add_card(new_card)
+                logger.info(f"Player {player_idx} received new card {Card.from_code(new_card)}.")
+        
+        self.gs.cambi_mask |= 1 << player_idx
     
     def _step_buchi_entry(self, action: Action):
         """Handle Buco entry decision."""
         player_idx = self._current_actor.id
         player = self.gs.players[player_idx]
         logger.info(f"Player {player_idx} action in BUCHI_ENTRY: {action}")
-        time.sleep(2)
+        self._pace()
         if action.kind == "take_buco":
             if player.is_playing:
                 raise ValueError(f"Player {player.name} already kept cards, cannot take buco")
@@ -382,183 +936,189 @@ class Engine:
             player.in_buco = True
             
             # Draw 4 cards for buco
-            for _ in range(4):
-                buco.add_card(self.gs.deck.draw())
+            drawn = self.gs.deck.draw_many(4)
+            buco.hand = (1 << drawn[0]) | (1 << drawn[1]) | (1 << drawn[2]) | (1 << drawn[3])
             buco.discard_pending = True
             logger.info(f"Player {player_idx} took a Buco with cards: {buco.cards}")
         elif action.kind == "pass":
             pass
         
-        self.gs.buchi_entry_done.append(player_idx)
+        self.gs.buchi_entry_mask |= 1 << player_idx
     
     def _step_buchi_discard(self, action: Action):
         """Handle Buco discard (discard 1 of 4 cards)."""
         if action.kind == "discard":
             buco = self.gs.buchi[self._current_actor.id]
             card_idx = action.payload["card_index"]
-            discarded = buco.cards.pop(card_idx)
-            logger.info(f"Buco {self._current_actor.id} discarded card {discarded}. Remaining cards: {buco.cards}")
+            discarded = mask_codes(buco.hand)[card_idx]
+            buco.remove_card(discarded)
+            logger.info(f"Buco {self._current_actor.id} discarded card {Card.from_code(discarded)}. Remaining cards: {buco.cards}")
             buco.discard_pending = False
     
     def _step_play(self, action: Action):
         """Handle playing a card in a trick."""
         logger.info(f"Actor {self._current_actor} action in PLAY: {action}")
-        time.sleep(2)
+        self._pace()
         if action.kind == "play_card":
             card = action.payload["card"]
             
             if self._current_actor.kind == "player":
                 player = self.gs.players[self._current_actor.id]
-                if card not in player.cards:
+                if not (player.hand >> card.code) & 1:
                     raise ValueError(f"Player {player.name} does not have card {card}")
-                player.remove_card(card)
-                self.gs.current_trick.append((self._current_actor, card))
+                player.remove_card(card.code)
             elif self._current_actor.kind == "buco":
                 buco = self.gs.buchi[self._current_actor.id]
-                if card not in buco.cards:
+                if not (buco.hand >> card.code) & 1:
                     raise ValueError(f"Buco {self._current_actor.id} does not have card {card}")
-                buco.cards.remove(card)
-                self.gs.current_trick.append((self._current_actor, card))
+                buco.remove_card(card.code)
+            else:
+                return
+            gs = self.gs
+            play = (self._current_actor, card)
+            gs.current_trick.append(play)
+            gs.trick_cards[gs.trick_len] = card.code
+            gs.trick_len += 1
+            gs.di_mano_pending = False
             logger.info(f"Actor {self._current_actor} played card {card}. Current trick: {self.gs.current_trick}")
 
             # Set lead suit if first card
-            if len(self.gs.current_trick) == 1:
+            if gs.trick_len == 1:
                 self.gs.trick_lead_suit = card.seed
+                self.gs.trick_lead_suit_id = SUIT_ID[card.seed]
             
-            # Update current winner
-            self._update_trick_winner()
+            # Update current winner: only the new card can take the trick
+            keys = TRICK_KEYS[gs.briscola_suit_id][gs.trick_lead_suit_id]
+            if gs.trick_winner is None or keys[card.code] > keys[gs.trick_winner[1].code]:
+                gs.trick_winner = play
     
     def _update_trick_winner(self):
-        """Update who is winning the current trick."""
+        """Recompute who is winning the current trick from scratch (after a restore)."""
         if not self.gs.current_trick:
             logger.info("No cards in current trick, no winner.")
             self.gs.trick_winner = None
             return
         
-        lead_suit = self.gs.trick_lead_suit
-        briscola_suit = self.gs.briscola_suit
-        
-        winner = self.gs.current_trick[0]
-        for actor, card in self.gs.current_trick[1:]:
-            if compare_cards(lead_suit, briscola_suit, card, winner[1]) > 0:
-                winner = (actor, card)
+        gs = self.gs
+        winner = gs.current_trick[trick_winner(gs.trick_cards, gs.trick_len, gs.trick_lead_suit_id,
+                                               gs.briscola_suit_id)]
         
         logger.info(f"Current trick winner: {winner}")
         self.gs.trick_winner = winner
     
     def _run_to_next_decision(self):
         """Run automatic transitions until next player decision is needed."""
-        while True:
-            if self.phase == Phase.DEAL_DECIDE:
-                # Deal to next player who hasn't been dealt
-                next_player = self._next_player_to_deal()
-                logger.info(f"Next player to deal to: {next_player}")
-                if next_player is not None:
-                    # Deal 3 cards
-                    player = self.gs.players[next_player]
-                    player.cards = [self.gs.deck.draw() for _ in range(3)]
-                    self.gs.dealt_to.append(next_player)
-                    self._current_actor = Actor("player", next_player)
-                    return
-                else:
-                    # All players dealt and decided, move to CAMBI
-                    logger.info("All players dealt and decided. Moving to CAMBI phase.")
-                    self.phase = Phase.CAMBI
-                    continue
-            
-            elif self.phase == Phase.CAMBI:
-                # Find next player who kept and hasn't done cambi
-                next_player = self._next_player_for_cambi()
-                if next_player is not None:
-                    self._current_actor = Actor("player", next_player)
-                    return
-                else:
-                    # All cambi done, move to BUCHI_ENTRY
-                    logger.info("All CAMBI done. Moving to BUCHI_ENTRY phase.")
-                    self.phase = Phase.BUCHI_ENTRY
-                    continue
-            
-            elif self.phase == Phase.BUCHI_ENTRY:
-                # Find next discarder who hasn't decided
-                next_player = self._next_player_for_buchi_entry()
-                if next_player is not None:
-                    logger.info(f"Next player for BUCHI_ENTRY: {next_player}")
-                    logger.info(f"Prompting player {next_player} for BUCHI_ENTRY decision.")
-                    self._current_actor = Actor("player", next_player)
-                    return
-                else:
-                    # Check if any buco needs discard
-                    pending_buco = self._next_buco_for_discard()
-                    if pending_buco is not None:
-                        self.phase = Phase.BUCHI_DISCARD
-                        logger.info(f"Moving to BUCHI_DISCARD phase for buco {pending_buco}.")
-                        self._current_actor = Actor("buco", pending_buco)
-                        return
-                    else:
-                        # All buchi resolved, move to PLAY
-                        self.phase = Phase.PLAY
-                        logger.info("All BUCHI_ENTRY done. Moving to PLAY phase.")
-                        self._start_play_phase()
-                        continue
-            
-            elif self.phase == Phase.BUCHI_DISCARD:
-                # After discard, check if more buchi need discard
-                pending_buco = self._next_buco_for_discard()
-                if pending_buco is not None:
-                    self._current_actor = Actor("buco", pending_buco)
-                    return
-                else:
-                    # All buchi resolved, move to PLAY
-                    self.phase = Phase.PLAY
-                    self._start_play_phase()
-                    continue
-            
-            elif self.phase == Phase.PLAY:
-                # Check if trick is complete
-                if len(self.gs.current_trick) == self._num_active_participants():
-                    logger.info("Trick complete. Resolving trick.")
-                    self._resolve_trick()
-                    # Check if all tricks done
-                    if len(self.gs.tricks) == 3:
-                        self.phase = Phase.SETTLE
-                        continue
-                    else:
-                        # Start next trick
-                        logger.info("Starting next trick.")
-                        self._start_next_trick()
-                        continue
-                else:
-                    # Need next player to play
-                    next_actor = self._next_actor_to_play()
-                    logger.info(f"Next actor to play: {next_actor}")
-                    if next_actor is not None:
-                        self._current_actor = next_actor
-                        return
-                    else:
-                        # Should not happen
-                        raise RuntimeError("No actor to play but trick not complete")
-            
-            elif self.phase == Phase.SETTLE:
-                # Automatic settlement
-                logger.info("Settling the hand.")
-                self._settle()
-                self.phase = Phase.FINE
-                self._current_actor = None
-                return
-            
-            elif self.phase == Phase.FINE:
-                logger.info("Hand complete. No further actions.")
-                self._current_actor = None
-                return
+        # Each advance handler returns True once a decision point (or FINE)
+        # is reached, False after an automatic transition to another phase
+        self.state_version += 1
+        advance = self._advance_dispatch
+        while not advance[self.phase]():
+            pass
+    
+    def _advance_deal_decide(self) -> bool:
+        # Deal to next player who hasn't been dealt
+        next_player = self._next_player_to_deal()
+        logger.info(f"Next player to deal to: {next_player}")
+        if next_player is not None:
+            # Deal 3 cards
+            player = self.gs.players[next_player]
+            drawn = self.gs.deck.draw_many(3)
+            player.hand = (1 << drawn[0]) | (1 << drawn[1]) | (1 << drawn[2])
+            self.gs.dealt_mask |= 1 << next_player
+            self._current_actor = Actor("player", next_player)
+            return True
+        # All players dealt and decided, move to CAMBI
+        logger.info("All players dealt and decided. Moving to CAMBI phase.")
+        self.phase = Phase.CAMBI
+        return False
+    
+    def _advance_cambi(self) -> bool:
+        # Find next player who kept and hasn't done cambi
+        next_player = self._next_player_for_cambi()
+        if next_player is not None:
+            self._current_actor = Actor("player", next_player)
+            return True
+        # All cambi done, move to BUCHI_ENTRY
+        logger.info("All CAMBI done. Moving to BUCHI_ENTRY phase.")
+        self.phase = Phase.BUCHI_ENTRY
+        return False
+    
+    def _advance_buchi_entry(self) -> bool:
+        # Find next discarder who hasn't decided
+        next_player = self._next_player_for_buchi_entry()
+        if next_player is not None:
+            logger.info(f"Next player for BUCHI_ENTRY: {next_player}")
+            logger.info(f"Prompting player {next_player} for BUCHI_ENTRY decision.")
+            self._current_actor = Actor("player", next_player)
+            return True
+        # Check if any buco needs discard
+        pending_buco = self._next_buco_for_discard()
+        if pending_buco is not None:
+            self.phase = Phase.BUCHI_DISCARD
+            logger.info(f"Moving to BUCHI_DISCARD phase for buco {pending_buco}.")
+            self._current_actor = Actor("buco", pending_buco)
+            return True
+        # All buchi resolved, move to PLAY
+        self.phase = Phase.PLAY
+        logger.info("All BUCHI_ENTRY done. Moving to PLAY phase.")
+        self._start_play_phase()
+        return False
+    
+    def _advance_buchi_discard(self) -> bool:
+        # After discard, check if more buchi need discard
+        pending_buco = self._next_buco_for_discard()
+        if pending_buco is not None:
+            self._current_actor = Actor("buco", pending_buco)
+            return True
+        # All buchi resolved, move to PLAY
+        self.phase = Phase.PLAY
+        self._start_play_phase()
+        return False
+    
+    def _advance_play(self) -> bool:
+        # Check if trick is complete
+        if self.gs.trick_len == self.gs.n_active:
+            logger.info("Trick complete. Resolving trick.")
+            self._resolve_trick()
+            # Check if all tricks done
+            if len(self.gs.tricks) == 3:
+                self.phase = Phase.SETTLE
+            else:
+                # Start next trick
+                logger.info("Starting next trick.")
+                self._start_next_trick()
+            return False
+        # Need next player to play
+        next_actor = self._next_actor_to_play()
+        logger.info(f"Next actor to play: {next_actor}")
+        if next_actor is None:
+            # Should not happen
+            raise RuntimeError("No actor to play but trick not complete")
+        self._current_actor = next_actor
+        return True
+    
+    def _advance_settle(self) -> bool:
+        # Automatic settlement
+        logger.info("Settling the hand.")
+        self._settle()
+        self.phase = Phase.FINE
+        self._current_actor = None
+        return True
+    
+    def _advance_fine(self) -> bool:
+        logger.info("Hand complete. No further actions.")
+        self._current_actor = None
+        return True
     
     def _next_player_to_deal(self) -> Optional[int]:
-        # Start from dealer's right, go counter-clockwise
-        start_idx = (self.gs.dealer + 1) % self.gs.n_players
-        for offset in range(self.gs.n_players):
-            idx = (start_idx + offset) % self.gs.n_players
-            if idx not in self.gs.dealt_to:
-                return idx
-        return None
+        # Start from dealer's right, go counter-clockwise. Players are dealt
+        # strictly in that order, so the ones already dealt are always a
+        # prefix of it and the next one follows from their count.
+        n = self.gs.n_players
+        dealt = self.gs.dealt_mask.bit_count()
+        if dealt == n:
+            return None
+        return (self.gs.dealer + 1 + dealt) % n
     
     def _next_player_for_cambi(self) -> Optional[int]:
         # Order: first kept player to dealer's right, then counter-clockwise from him
@@ -566,7 +1126,7 @@ class Engine:
         for offset in range(self.gs.n_players):
             idx = (start_idx + offset) % self.gs.n_players
             player = self.gs.players[idx]
-            if player.is_playing and idx not in self.gs.cambi_done:
+            if player.is_playing and not (self.gs.cambi_mask >> idx) & 1:
                 return idx
         return None
     
@@ -576,29 +1136,34 @@ class Engine:
         for offset in range(self.gs.n_players):
             idx = (start_idx + offset) % self.gs.n_players
             player = self.gs.players[idx]
-            if not player.is_playing and idx not in self.gs.buchi_entry_done:
+            if not player.is_playing and not (self.gs.buchi_entry_mask >> idx) & 1:
                 return idx
         return None
     
     def _next_buco_for_discard(self) -> Optional[int]:
         """Find next buco that needs discard decision."""
         for i, buco in enumerate(self.gs.buchi):
-            if buco.discard_pending and len(buco.cards) == 4:
+            if buco.discard_pending and buco.hand.bit_count() == 4:
                 return i
         return None
     
     def _start_play_phase(self):
         """Initialize play phase - determine who leads first trick."""
-        # Reset trick state
+        self.gs.build_turn_ring()
+        # Reset trick state (the previous list now belongs to tricks)
         self.gs.current_trick = []
+        self.gs.trick_len = 0
         self.gs.trick_lead_suit = None
+        self.gs.trick_lead_suit_id = None
         self.gs.trick_winner = None
     
     def _start_next_trick(self):
         """Start next trick - winner of previous trick leads."""
-        # Reset trick state
+        # Reset trick state (the previous list now belongs to tricks)
         self.gs.current_trick = []
+        self.gs.trick_len = 0
         self.gs.trick_lead_suit = None
+        self.gs.trick_lead_suit_id = None
         self.gs.trick_winner = None
     
     def _next_actor_to_play(self) -> Optional[Actor]:
@@ -630,38 +1195,16 @@ class Engine:
     
     def _next_actor_ccw(self, actor: Actor) -> Optional[Actor]:
         """Get next actor counter-clockwise."""
-        # Get all active participants in order
-        active_participants = []
-        
-        # Start from dealer's right, go CCW
-        start_idx = (self.gs.dealer + 1) % self.gs.n_players
-        for offset in range(self.gs.n_players):
-            idx = (start_idx + offset) % self.gs.n_players
-            player = self.gs.players[idx]
-            
-            if player.is_playing:
-                active_participants.append(Actor("player", idx))
-            elif player.in_buco:
-                # Find which buco this player is in
-                for buco_idx, buco in enumerate(self.gs.buchi):
-                    if player in buco.players:
-                        # Only add buco once (if first player in buco)
-                        if buco.players[0] == player:
-                            active_participants.append(Actor("buco", buco_idx))
-                        break
-        
-        # Find current actor in list
-        try:
-            current_idx = active_participants.index(actor)
-            next_idx = (current_idx + 1) % len(active_participants)
-            return active_participants[next_idx]
-        except ValueError:
+        ring = self.gs.turn_ring
+        pos = self.gs.turn_index.get(actor)
+        if pos is None:
             # Actor not found (shouldn't happen)
             return None
+        return ring[(pos + 1) % len(ring)]
     
     def _num_active_participants(self) -> int:
-        """Count active participants (kept players + buchi)."""
-        return len(self.gs.playing_players) + len(self.gs.buchi)
+        """Count active participants (kept players + buchi), fixed for the PLAY phase."""
+        return self.gs.n_active
     
     def _resolve_trick(self):
         """Resolve current trick and record winner."""
@@ -669,7 +1212,9 @@ class Engine:
             return
         
         winner_actor, winner_card = self.gs.trick_winner
-        self.gs.tricks.append(self.gs.current_trick.copy())
+        # Hand the finished trick list over to tricks instead of copying it;
+        # the next trick starts on a fresh list
+        self.gs.tricks.append(self.gs.current_trick)
         
         # Award trick to winner
         if winner_actor.kind == "player":
@@ -686,128 +1231,180 @@ class Engine:
         if not trick:
             raise ValueError("Empty trick")
         
-        lead_suit = trick[0][1].seed
-        briscola_suit = self.gs.briscola_suit
-        
-        winner = trick[0]
-        for actor, card in trick[1:]:
-            if compare_cards(lead_suit, briscola_suit, card, winner[1]) > 0:
-                winner = (actor, card)
+        codes = [card.code for _, card in trick]
+        winner = trick[trick_winner(codes, len(codes), SUIT_ID[trick[0][1].seed],
+                                    self.gs.briscola_suit_id)]
         
         logger.info(f"Trick winner: {winner}")
         return winner
     
     def _settle(self):
         """Handle settlement: pot distribution, bestia payments, dealer fee."""
-        participants = self.gs.playing_players + [
-            p for buco in self.gs.buchi for p in buco.players
-        ]
-        participant_tricks = [
-            (p, p.tricks_won) for p in self.gs.playing_players
-        ] + [
-            (buco, buco.tricks_won) for buco in self.gs.buchi
-        ]
+        gs = self.gs
+        pot = gs.pot
+        # One (players sharing the result, tricks) entry per participant; a
+        # lone player is a group of one, so both kinds settle the same way
+        participant_tricks = [((p,), p.tricks_won) for p in gs.playing_players]
+        participant_tricks += [(buco.players, buco.tricks_won) for buco in gs.buchi]
         
         # Check piatto salvo
-        num_participants = len(participant_tricks)
-        if num_participants >= 3:
-            all_one_trick = all(tricks == 1 for _, tricks in participant_tricks)
-            if all_one_trick:
-                # Piatto salvo - pot rolls over
-                # Still add dealer fee and rotate dealer
-                logger.info("Piatto salvo! All participants won 1 trick each. Pot rolls over.")
-                self.gs.pot += 30  # €0.30 = 30 cents
-                self.gs.dealer = (self.gs.dealer + 1) % self.gs.n_players
-                return
+        if len(participant_tricks) >= 3 and all(tricks == 1 for _, tricks in participant_tricks):
+            # Piatto salvo - pot rolls over
+            # Still add dealer fee and rotate dealer
+            logger.info("Piatto salvo! All participants won 1 trick each. Pot rolls over.")
+            gs.pot += 30  # €0.30 = 30 cents
+            gs.dealer = (gs.dealer + 1) % gs.n_players
+            return
         
-        # Normal payout: each trick = 1/3 of pot
-        trick_value = self.gs.pot // 3
-        for entity, tricks in participant_tricks:
-            if isinstance(entity, Player):
-                payout = tricks * trick_value
-                entity.bankroll += payout
-                logger.info(f"Player {entity.name} won {tricks} tricks, receiving payout of {payout}. New bankroll: {entity.bankroll}")
-            elif isinstance(entity, Buco):
-                # Split among buco players
-                payout_per_player = (tricks * trick_value) // len(entity.players)
-                for player in entity.players:
-                    player.bankroll += payout_per_player
-                    logger.info(f"Buco player {player.name} won {tricks} tricks, receiving payout of {payout_per_player}. New bankroll: {player.bankroll}")
-        
-        # Bestia payments: 0 tricks = pay pot amount into next pot
+        # Normal payout: each trick = 1/3 of pot, split among the group.
+        # Bestia: 0 tricks = pay pot amount (split among the group) into next pot
+        trick_value = pot // 3
         bestia_payments = 0
-        for entity, tricks in participant_tricks:
-            if tricks == 0:
-                if isinstance(entity, Player):
-                    entity.bankroll -= self.gs.pot
-                    bestia_payments += self.gs.pot
-                elif isinstance(entity, Buco):
-                    # Split payment among buco players
-                    payment_per_player = self.gs.pot // len(entity.players)
-                    for player in entity.players:
-                        player.bankroll -= payment_per_player
-                    bestia_payments += self.gs.pot
+        for group, tricks in participant_tricks:
+            size = len(group)
+            if tricks:
+                delta = tricks * trick_value // size
+            else:
+                delta = -(pot // size)
+                bestia_payments += pot
+            for player in group:
+                player.bankroll += delta
+                logger.info(f"Player {player.name} won {tricks} tricks, bankroll change {delta}. New bankroll: {player.bankroll}")
         
         # New pot = bestia payments
-        self.gs.pot = bestia_payments
+        gs.pot = bestia_payments
         
         # Dealer fee and rotation
-        self.gs.pot += 30  # €0.30
-        self.gs.dealer = (self.gs.dealer + 1) % self.gs.n_players
+        gs.pot += 30  # €0.30
+        gs.dealer = (gs.dealer + 1) % gs.n_players
+    
+    def snapshot_bytes(self, buf: Optional[bytearray] = None) -> bytearray:
+        """
+        Pack the full engine state into a compact binary buffer.
+        Pass the same bytearray back in to reuse it across calls; it is
+        resized only if the state needs more room. See restore_bytes().
+        """
+        gs = self.gs
+        played = [play for trick in gs.tricks for play in trick] + gs.current_trick
+        size = (_SNAP_HEADER.size + _SNAP_PLAYER.size * gs.n_players
+                + _SNAP_BUCO.size * len(gs.buchi) + _SNAP_PLAY.size * len(played))
+        if buf is None:
+            buf = bytearray(size)
+        elif len(buf) != size:
+            buf[:] = bytes(size)
+        
+        actor = self._current_actor
+        decided = sum(1 << idx for idx in gs.decisions)
+        _SNAP_HEADER.pack_into(
+            buf, 0,
+            _PHASE_INDEX[self.phase], gs.pot, gs.dealer, gs.n_players, len(gs.buchi),
+            gs.briscola_card.code if gs.briscola_card else -1,
+            -1 if gs.trick_lead_suit_id is None else gs.trick_lead_suit_id,
+            _ACTOR_KIND_INDEX[actor.kind] if actor else 0, actor.id if actor else 0,
+            gs.dealt_mask, decided, gs.cambi_mask, gs.buchi_entry_mask,
+            len(gs.tricks), len(gs.current_trick), gs.deck.top, gs.deck.cards.tobytes(),
+        )
+        offset = _SNAP_HEADER.size
+        for p in gs.players:
+            _SNAP_PLAYER.pack_into(buf, offset, p.hand, p.bankroll, p.tricks_won,
+                                   p.is_playing | (p.in_buco << 1))
+            offset += _SNAP_PLAYER.size
+        for b in gs.buchi:
+            players_mask = _indices_mask(gs.players.index(p) for p in b.players)
+            _SNAP_BUCO.pack_into(buf, offset, b.hand, players_mask, b.tricks_won, b.discard_pending)
+            offset += _SNAP_BUCO.size
+        for play_actor, card in played:
+            _SNAP_PLAY.pack_into(buf, offset, _ACTOR_KIND_INDEX[play_actor.kind], play_actor.id, card.code)
+            offset += _SNAP_PLAY.size
+        return buf
     
-    def get_player_hand(self, player_id: int) -> List[Card]:
+    def restore_bytes(self, buf) -> None:
+        """Restore a state packed by snapshot_bytes() on an engine with the same players."""
+        self.state_version += 1
+        gs = self.gs
+        (phase, pot, dealer, n_players, n_buchi, briscola, lead_suit, actor_kind, actor_id,
+         dealt, decided, cambi, buchi_entry, n_tricks, trick_len, top, deck_bytes) = \
+            _SNAP_HEADER.unpack_from(buf, 0)
+        if n_players != gs.n_players:
+            raise ValueError(f"Snapshot has {n_players} players, engine has {gs.n_players}")
+        
+        self.phase = _PHASES[phase]
+        gs.pot = pot
+        gs.dealer = dealer
+        gs.deck.cards[:] = array("b", deck_bytes)
+        gs.deck.top = top
+        gs.set_briscola(Card.from_code(briscola) if briscola >= 0 else None)
+        
+        offset = _SNAP_HEADER.size
+        for p in gs.players:
+            p.hand, p.bankroll, p.tricks_won, flags = _SNAP_PLAYER.unpack_from(buf, offset)
+            p.is_playing = bool(flags & 1)
+            p.in_buco = bool(flags & 2)
+            offset += _SNAP_PLAYER.size
+        
+        # Player lists are rebuilt in dealing order (counter-clockwise from the dealer's right)
+        order = [(dealer + 1 + k) % n_players for k in range(n_players)]
+        gs.dealt_mask = dealt
+        gs.decisions = {idx: gs.players[idx].is_playing for idx in order if (decided >> idx) & 1}
+        gs.playing_players = [gs.players[idx] for idx in order if gs.decisions.get(idx)]
+        gs.cambi_mask = cambi
+        gs.buchi_entry_mask = buchi_entry
+        
+        gs.buchi = []
+        for buco_id in range(n_buchi):
+            hand, players_mask, tricks_won, discard_pending = _SNAP_BUCO.unpack_from(buf, offset)
+            buco = Buco([gs.players[idx] for idx in range(n_players) if (players_mask >> idx) & 1], buco_id)
+            buco.hand = hand
+            buco.tricks_won = tricks_won
+            buco.discard_pending = discard_pending
+            gs.buchi.append(buco)
+            offset += _SNAP_BUCO.size
+        gs.next_buco_id = n_buchi
+        gs.build_turn_ring()
+        
+        played = []
+        n_played = (len(buf) - offset) // _SNAP_PLAY.size
+        for _ in range(n_played):
+            kind, play_actor_id, code = _SNAP_PLAY.unpack_from(buf, offset)
+            played.append((Actor(_ACTOR_KINDS[kind], play_actor_id), Card.from_code(code)))
+            offset += _SNAP_PLAY.size
+        per_trick = (n_played - trick_len) // n_tricks if n_tricks else 0
+        gs.tricks = [played[i * per_trick:(i + 1) * per_trick] for i in range(n_tricks)]
+        gs.current_trick = played[n_played - trick_len:]
+        gs.load_trick_buffer()
+        gs.di_mano_pending = not gs.tricks and not gs.current_trick
+        gs.trick_lead_suit_id = lead_suit if lead_suit >= 0 else None
+        gs.trick_lead_suit = gs.current_trick[0][1].seed if gs.current_trick else None
+        self._update_trick_winner()
+        
+        self._current_actor = Actor(_ACTOR_KINDS[actor_kind], actor_id) if actor_kind else None
+    
+    def get_player_hand(self, player_id: int) -> Tuple[Card, ...]:
         """Get cards for a specific player (for GUI display)."""
         if player_id < 0 or player_id >= len(self.gs.players):
             raise ValueError(f"Invalid player_id: {player_id}")
         return self.gs.players[player_id].get_cards()
     
-    def get_buco_hand(self, buco_id: int) -> List[Card]:
+    def get_buco_hand(self, buco_id: int) -> Tuple[Card, ...]:
         """Get cards for a specific buco (for GUI display)."""
         if buco_id < 0 or buco_id >= len(self.gs.buchi):
             raise ValueError(f"Invalid buco_id: {buco_id}")
-        return self.gs.buchi[buco_id].cards.copy()
+        return self.gs.buchi[buco_id].cards
     
     def snapshot(self) -> Dict[str, Any]:
-        """Return JSON-serializable snapshot of current state for GUI."""
-        return {
-            "phase": self.phase.value,
-            "current_actor": {
-                "kind": self._current_actor.kind,
-                "id": self._current_actor.id
-            } if self._current_actor else None,
-            "pot": self.gs.pot,
-            "dealer": self.gs.dealer,
-            "briscola_card": {
-                "seed": self.gs.briscola_card.seed,
-                "value": self.gs.briscola_card.value
-            } if self.gs.briscola_card else None,
-            "briscola_suit": self.gs.briscola_suit,
-            "players": [
-                {
-                    "name": p.name,
-                    "bankroll": p.bankroll,
-                    "is_playing": p.is_playing,
-                    "in_buco": p.in_buco,
-                    "tricks_won": p.tricks_won,
-                    "num_cards": len(p.cards),
-                }
-                for p in self.gs.players
-            ],
-            "buchi": [
-                {
-                    "buco_id": b.buco_id,
-                    "player_names": [p.name for p in b.players],
-                    "tricks_won": b.tricks_won,
-                    "num_cards": len(b.cards),
-                }
-                for b in self.gs.buchi
-            ],
-            "current_trick": [
-                {
-                    "actor": {"kind": actor.kind, "id": actor.id},
-                    "card": {"seed": card.seed, "value": card.value}
-                }
-                for actor, card in self.gs.current_trick
-            ],
-            "tricks_completed": len(self.gs.tricks),
-        }
+        """
+        Return JSON-serializable snapshot of current state for GUI.
+        
+        The dict is built once per state: polls between two decisions get
+        the same cached object back, so callers must not mutate it. The
+        cache is keyed on state_version, which every engine transition (step,
+        reset, restore_bytes, ...) bumps, and on the gs object; code that
+        edits gs in place must call _run_to_next_decision() or bump
+        state_version itself.
+        """
+        cache = self._snapshot_cache
+        if cache is not None and cache[0] == self.state_version and cache[1] is self.gs:
+            return cache[2]
+        snapshot = self._snapshot_impl(self)
+        self._snapshot_cache = (self.state_version, self.gs, snapshot)
+        return snapshot
@@ -1,7 +1,7 @@
 """Game window showing the table and game state."""
 from pathlib import Path
-import random
 import math
+import random
 from typing import Optional, Dict, List
 from PySide6 import QtWidgets, QtCore, QtGui
 from engine import Engine, Player, Action, Phase, Card
@@ -31,18 +31,173 @@ SEED_TO_SPRITE = {
 }
 
 
+# Styles of the table widgets, selected by object name. Applied once on each
+# root widget (window, player widgets, scene items) instead of per label.
+TABLE_QSS = """
+QLabel#playerPhoto {
+    border-radius: 22px;
+    background-color: #ddd;
+    border: 2px solid #3498db;
+}
+QLabel#playerName {
+    font-weight: bold;
+    font-size: 10px;
+    color: white;
+    background-color: rgba(0, 0, 0, 140);
+    padding: 2px 4px;
+    border-radius: 3px;
+}
+QLabel#playerBankroll { font-size: 9px; color: #f39c12; }
+QLabel#playerStatus { font-size: 9px; color: #95a5a6; }
+QLabel#cardFace {
+    border: 1px solid #34495e;
+    border-radius: 3px;
+    background-color: white;
+}
+QLabel#phase { font-size: 16px; font-weight: bold; padding: 5px; }
+QLabel#timer {
+    font-size: 18px;
+    font-weight: bold;
+    color: #e74c3c;
+    padding: 5px 15px;
+    background-color: #ecf0f1;
+    border-radius: 5px;
+}
+QLabel#timer[urgent="true"] { background-color: #fadbd8; }
+QLabel#briscolaCard {
+    border: 2px solid #f39c12;
+    border-radius: 4px;
+    background-color: white;
+}
+QWidget#trickContainer { background-color: transparent; }
+QLabel#trickTitle {
+    font-size: 11px;
+    font-weight: bold;
+    color: white;
+    background-color: rgba(0, 0, 0, 200);
+    padding: 4px 8px;
+    border-radius: 4px;
+}
+QLabel#trickName {
+    font-size: 9px;
+    font-weight: bold;
+    color: white;
+    background-color: rgba(52, 73, 94, 220);
+    padding: 2px 4px;
+    border-radius: 3px;
+}
+QLabel#trickCard {
+    border: 2px solid #2c3e50;
+    border-radius: 5px;
+    background-color: white;
+}
+"""
+
+# Decoded and scaled sprites by (path, width, height), shared by every widget
+_PIXMAP_CACHE: Dict[tuple, QtGui.QPixmap] = {}
+
+
+def get_scaled_pixmap(path: Path, w: int, h: int) -> QtGui.QPixmap:
+    """
+    Load path scaled to fit w x h, decoding each sprite/size pair only once.
+    A missing or unreadable file gives a null pixmap, which is cached too, so
+    callers check isNull() instead of touching the filesystem.
+    """
+    key = (str(path), w, h)
+    pixmap = _PIXMAP_CACHE.get(key)
+    if pixmap is None:
+        pixmap = QtGui.QPixmap(key[0])
+        if not pixmap.isNull():
+            pixmap = pixmap.scaled(w, h, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
+        _PIXMAP_CACHE[key] = pixmap
+    return pixmap
+
+
+# Phase label text by snapshot phase value
+PHASE_LABELS = {phase.value: f"Phase: {phase.value.upper().replace('_', ' ')}" for phase in Phase}
+
+# Sprite file of every card, built once for the 40-card deck
+_SPRITE_DIR = Path(__file__).parent / "sprites" / "cards"
+_SPRITE_PATHS: Dict[tuple, Path] = {
+    (seed, value): _SPRITE_DIR / f"{seed_char}{value_num}.png"
+    for seed, seed_char in SEED_TO_SPRITE.items()
+    for value, value_num in VALUE_TO_SPRITE.items()
+}
+
+_BACK_PATH = Path(__file__).parent / "sprites" / "back" / "back.png"
+
+# Scaled sizes card faces are shown at: player hands, briscola, current trick
+_CARD_FACE_SIZES = ((36, 54), (48, 74), (46, 71))
+
+
 def card_to_sprite_path(card: Card) -> Path:
     """Convert engine Card to sprite file path."""
-    sprite_dir = Path(__file__).parent / "sprites" / "cards"
-    seed_char = SEED_TO_SPRITE[card.seed]
-    value_num = VALUE_TO_SPRITE[card.value]
-    return sprite_dir / f"{seed_char}{value_num}.png"
+    return _SPRITE_PATHS[card.seed, card.value]
+
+
+class _SpriteDecoder(QtCore.QRunnable):
+    """Decodes and scales sprites as QImages, which unlike QPixmaps may be built off the GUI thread."""
+    def __init__(self, jobs: List[tuple], done: QtCore.SignalInstance):
+        super().__init__()
+        self.jobs = jobs
+        self.done = done
+    
+    def run(self):
+        images = {}
+        for path, w, h in self.jobs:
+            image = QtGui.QImage(str(path))
+            if not image.isNull():
+                image = image.scaled(w, h, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
+            images[(str(path), w, h)] = image
+        self.done.emit(images)
+
+
+class _SpriteLoader(QtCore.QObject):
+    """Lives in the GUI thread and turns decoded images into cached pixmaps."""
+    loaded = QtCore.Signal(object)
+    
+    def __init__(self):
+        super().__init__()
+        self.loaded.connect(self._store)
+    
+    @QtCore.Slot(object)
+    def _store(self, images: dict):
+        for key, image in images.items():
+            # Sprites already loaded on demand in the meantime are kept
+            if key not in _PIXMAP_CACHE:
+                _PIXMAP_CACHE[key] = QtGui.QPixmap.fromImage(image)
+
+
+_sprite_loader: Optional[_SpriteLoader] = None
+
+
+def preload_card_pixmaps():
+    """
+    Fill the pixmap cache with every card face at every display size,
+    decoding on a worker thread. Until the worker is done,
+    get_scaled_pixmap() still loads whatever is missing on demand.
+    """
+    global _sprite_loader
+    if _sprite_loader is not None:
+        return
+    _sprite_loader = _SpriteLoader()
+    jobs = [(path, w, h) for path in _SPRITE_PATHS.values() for w, h in _CARD_FACE_SIZES]
+    QtCore.QThreadPool.globalInstance().start(_SpriteDecoder(jobs, _sprite_loader.loaded))
 
 
 class PlayerWidget(QtWidgets.QWidget):
     """Widget representing a player at the table."""
+    # Card size: compact (38x56 visible)
+    CARD_W, CARD_H = 38, 56
+    # Cards in a dealt hand: card labels preallocated per widget
+    MAX_CARDS = 3
+    # Round profile photos by photo path, shared by all player widgets
+    _AVATAR_CACHE: Dict[str, QtGui.QPixmap] = {}
+    
     def __init__(self, player_data: dict, position: int, total_players: int, parent=None):
         super().__init__(parent)
+        # Scene widgets don't inherit the window's stylesheet, so each gets the table sheet
+        self.setStyleSheet(TABLE_QSS)
         self.player_data = player_data
         self.position = position
         self.total_players = total_players
@@ -56,28 +211,12 @@ class PlayerWidget(QtWidgets.QWidget):
         self.photo_label = QtWidgets.QLabel()
         self.photo_label.setFixedSize(44, 44)
         self.photo_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-        self.photo_label.setStyleSheet("""
-            QLabel {
-                border-radius: 22px;
-                background-color: #ddd;
-                border: 2px solid #3498db;
-            }
-        """)
+        self.photo_label.setObjectName("playerPhoto")
         
         if player_data.get("photo_path"):
-            pixmap = QtGui.QPixmap(player_data["photo_path"])
-            if not pixmap.isNull():
-                pixmap = pixmap.scaled(40, 40, QtCore.Qt.KeepAspectRatioByExpanding,
-                                      QtCore.Qt.SmoothTransformation)
-                circular = QtGui.QPixmap(40, 40)
-                circular.fill(QtCore.Qt.GlobalColor.transparent)
-                painter = QtGui.QPainter(circular)
-                painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
-                painter.setBrush(QtGui.QBrush(pixmap))
-                painter.setPen(QtCore.Qt.PenStyle.NoPen)
-                painter.drawEllipse(0, 0, 40, 40)
-                painter.end()
-                self.photo_label.setPixmap(circular)
+            avatar = self.circular_avatar(player_data["photo_path"])
+            if not avatar.isNull():
+                self.photo_label.setPixmap(avatar)
         
         self.layout.addWidget(self.photo_label, alignment=QtCore.Qt.AlignmentFlag.AlignCenter)
         
@@ -86,99 +225,119 @@ class PlayerWidget(QtWidgets.QWidget):
         self.name_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
         self.name_label.setMaximumWidth(100)
         self.name_label.setWordWrap(True)
-        self.name_label.setStyleSheet("""
-            QLabel {
-                font-weight: bold;
-                font-size: 10px;
-                color: white;
-                background-color: rgba(0, 0, 0, 140);
-                padding: 2px 4px;
-                border-radius: 3px;
-            }
-        """)
+        self.name_label.setObjectName("playerName")
         self.layout.addWidget(self.name_label)
         
         # Bankroll (compact)
         self.bankroll_label = QtWidgets.QLabel(f"€{player_data['bankroll']:.2f}")
+        self._last_bankroll_cents = round(player_data["bankroll"] * 100)
         self.bankroll_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-        self.bankroll_label.setStyleSheet("font-size: 9px; color: #f39c12;")
+        self.bankroll_label.setObjectName("playerBankroll")
         self.layout.addWidget(self.bankroll_label)
         
         # Cards container
         self.cards_container = QtWidgets.QWidget()
-        self.cards_layout = QtWidgets.QHBoxLayout(self.cards_container)
+        # One grid cell per card, filled once: refreshes only swap pixmaps and visibility
+        self.cards_layout = QtWidgets.QGridLayout(self.cards_container)
         self.cards_layout.setContentsMargins(0, 0, 0, 0)
         self.cards_layout.setSpacing(2)
         self.layout.addWidget(self.cards_container)
+        # Card labels, created on demand and reused across refreshes
+        self._card_labels: List[QtWidgets.QLabel] = []
+        for _ in range(self.MAX_CARDS):
+            self._add_card_label().setVisible(False)
         
         # Status label (compact)
         self.status_label = QtWidgets.QLabel("")
+        self._last_status = ""
         self.status_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-        self.status_label.setStyleSheet("font-size: 9px; color: #95a5a6;")
+        self.status_label.setObjectName("playerStatus")
         self.layout.addWidget(self.status_label)
         
         # Fixed max size so the widget doesn't grow
         self.setMaximumWidth(140)
     
+    @classmethod
+    def circular_avatar(cls, photo_path: str) -> QtGui.QPixmap:
+        """40x40 round crop of a profile photo, drawn once per photo path (null if unreadable)."""
+        avatar = cls._AVATAR_CACHE.get(photo_path)
+        if avatar is None:
+            avatar = QtGui.QPixmap()
+            pixmap = QtGui.QPixmap(photo_path)
+            if not pixmap.isNull():
+                pixmap = pixmap.scaled(40, 40, QtCore.Qt.KeepAspectRatioByExpanding,
+                                      QtCore.Qt.SmoothTransformation)
+                avatar = QtGui.QPixmap(40, 40)
+                avatar.fill(QtCore.Qt.GlobalColor.transparent)
+                painter = QtGui.QPainter(avatar)
+                painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
+                painter.setBrush(QtGui.QBrush(pixmap))
+                painter.setPen(QtCore.Qt.PenStyle.NoPen)
+                painter.drawEllipse(0, 0, 40, 40)
+                painter.end()
+            cls._AVATAR_CACHE[photo_path] = avatar
+        return avatar
+    
     def update_cards(self, cards: List[Card], show_front: bool, back_path: Path):
         """Update displayed cards."""
         if not self.cards_layout:
             return
         
-        # Clear existing cards safely
-        for i in reversed(range(self.cards_layout.count())):
-            item = self.cards_layout.itemAt(i)
-            if item and item.widget():
-                w = item.widget()
-                w.setParent(None)
-                w.deleteLater()
-        
-        # Card size: compact (38x56 visible)
-        card_w, card_h = 38, 56
+        pixmaps = []
         for card in cards:
             if card is None:
                 continue
-                
-            card_label = QtWidgets.QLabel()
-            card_label.setFixedSize(card_w, card_h)
-            card_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-            card_label.setStyleSheet("""
-                QLabel {
-                    border: 1px solid #34495e;
-                    border-radius: 3px;
-                    background-color: white;
-                }
-            """)
-            
+            pixmap = QtGui.QPixmap()
             try:
-                if show_front:
-                    card_path = card_to_sprite_path(card)
-                    if card_path.exists():
-                        pixmap = QtGui.QPixmap(str(card_path))
-                    else:
-                        pixmap = QtGui.QPixmap()
+                path = card_to_sprite_path(card) if show_front else back_path
+                pixmap = get_scaled_pixmap(path, self.CARD_W - 2, self.CARD_H - 2)
+            except Exception:
+                logger.exception("Error loading card image")
+            pixmaps.append(pixmap)
+        self._show_card_pixmaps(pixmaps)
+    
+    def show_card_backs(self, count: int, back_pixmap: QtGui.QPixmap):
+        """Show count face-down cards, back_pixmap already scaled to the card size."""
+        self._show_card_pixmaps([back_pixmap] * count)
+    
+    def _add_card_label(self) -> QtWidgets.QLabel:
+        """Append a card label in the next grid column."""
+        card_label = QtWidgets.QLabel()
+        card_label.setFixedSize(self.CARD_W, self.CARD_H)
+        card_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        card_label.setObjectName("cardFace")
+        self.cards_layout.addWidget(card_label, 0, len(self._card_labels))
+        self._card_labels.append(card_label)
+        return card_label
+    
+    def _show_card_pixmaps(self, pixmaps: List[QtGui.QPixmap]):
+        """Show pixmaps in the reusable card labels and hide the ones left over."""
+        labels = self._card_labels
+        while len(labels) < len(pixmaps):
+            self._add_card_label()
+        
+        for i, card_label in enumerate(labels):
+            if i < len(pixmaps):
+                if pixmaps[i].isNull():
+                    card_label.clear()
                 else:
-                    if back_path.exists():
-                        pixmap = QtGui.QPixmap(str(back_path))
-                    else:
-                        pixmap = QtGui.QPixmap()
-                
-                if not pixmap.isNull():
-                    pixmap = pixmap.scaled(card_w - 2, card_h - 2, QtCore.Qt.KeepAspectRatio,
-                                          QtCore.Qt.SmoothTransformation)
-                    card_label.setPixmap(pixmap)
-            except Exception as e:
-                print(f"Error loading card image: {e}")
-            
-            self.cards_layout.addWidget(card_label)
+                    card_label.setPixmap(pixmaps[i])
+                card_label.setVisible(True)
+            else:
+                card_label.setVisible(False)
     
     def update_status(self, text: str):
         """Update status text."""
-        self.status_label.setText(text)
+        if text != self._last_status:
+            self._last_status = text
+            self.status_label.setText(text)
     
     def update_bankroll(self, bankroll: float):
         """Update bankroll display."""
-        self.bankroll_label.setText(f"€{bankroll:.2f}")
+        cents = round(bankroll * 100)
+        if cents != self._last_bankroll_cents:
+            self._last_bankroll_cents = cents
+            self.bankroll_label.setText(f"€{bankroll:.2f}")
 
 
 class GameWindow(QtWidgets.QMainWindow):
@@ -186,8 +345,15 @@ class GameWindow(QtWidgets.QMainWindow):
     def __init__(self, players_data: List[dict], parent=None):
         super().__init__(parent)
         self.setWindowTitle("BestIA - Game")
+        self.setStyleSheet(TABLE_QSS)
         self.setMinimumSize(1200, 800)
         
+        # Decode all card sprites in the background instead of on the first refreshes
+        preload_card_pixmaps()
+        
+        # Card back at the player card size, shared by every opponent card
+        self._back_pixmap = get_scaled_pixmap(_BACK_PATH, PlayerWidget.CARD_W - 2, PlayerWidget.CARD_H - 2)
+        
         # Store player data
         self.players_data = players_data
         self.player_widgets: Dict[int, PlayerWidget] = {}
@@ -200,12 +366,22 @@ class GameWindow(QtWidgets.QMainWindow):
         
         # Create engine
         self.engine = Engine(engine_players, pot=300, dealer=0, seed=None)
+        # Dedicated generator for AI moves, seeded from the engine's stream so
+        # a whole table can be replayed from one engine seed
+        self._ai_rng = random.Random(self.engine.rng.getrandbits(64))
         self.human_player_index = 0  # First player is human (can be made configurable)
         
+        # Single-shot, zero-delay timer behind update_from_engine()
+        self._update_timer = QtCore.QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(0)
+        self._update_timer.timeout.connect(self._do_update_from_engine)
+        
         # Timer for actions
         self.action_timer = QtCore.QTimer()
         self.action_timer.timeout.connect(self.on_timer_timeout)
         self.timer_seconds = 60
+        self._ai_move_pending = False
         self.timer_label: Optional[QtWidgets.QLabel] = None
         
         # Central widget
@@ -219,20 +395,15 @@ class GameWindow(QtWidgets.QMainWindow):
         # Top bar with timer and phase info
         top_bar = QtWidgets.QHBoxLayout()
         self.phase_label = QtWidgets.QLabel("Phase: DEAL_DECIDE")
-        self.phase_label.setStyleSheet("font-size: 16px; font-weight: bold; padding: 5px;")
+        self.phase_label.setObjectName("phase")
         top_bar.addWidget(self.phase_label)
         
         top_bar.addStretch()
         
         self.timer_label = QtWidgets.QLabel("30s")
-        self.timer_label.setStyleSheet("""
-            font-size: 18px;
-            font-weight: bold;
-            color: #e74c3c;
-            padding: 5px 15px;
-            background-color: #ecf0f1;
-            border-radius: 5px;
-        """)
+        self.timer_label.setObjectName("timer")
+        self.timer_label.setProperty("urgent", False)
+        self._timer_urgent = False
         top_bar.addWidget(self.timer_label)
         
         main_layout.addLayout(top_bar)
@@ -250,7 +421,8 @@ class GameWindow(QtWidgets.QMainWindow):
         self.action_layout.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
         main_layout.addWidget(self.action_area)
         
-        # Load table image
+        # Load table image (sets the scene center; defaults for a 1200x800 table)
+        self._scene_center = (600, 400)
         self.setup_table()
         
         # Setup players around table
@@ -258,14 +430,16 @@ class GameWindow(QtWidgets.QMainWindow):
         
         # Briscola card display (center of table) - create after table is loaded
         self.briscola_label = None
+        self.briscola_proxy: Optional[QtWidgets.QGraphicsProxyWidget] = None
         self.trick_label = None
+        self.trick_proxy: Optional[QtWidgets.QGraphicsProxyWidget] = None
         self.trick_cards_container = None  # Container for cards in current trick
+        self._trick_slots = []  # (widget, name label, card label) per trick card, reused
+        # Snapshot parts as last drawn, to skip redrawing what did not change
+        self._last_rendered = {"phase": None, "briscola": None, "trick": None, "players": {}}
         
-        # Connect to engine updates
+        # Connect to engine updates; the refresh also starts the first turn
         self.update_from_engine()
-        
-        # Start action timer
-        self.start_action_timer()
     
     def setup_table(self):
         """Load and display table image."""
@@ -277,6 +451,7 @@ class GameWindow(QtWidgets.QMainWindow):
                 item = self.table_scene.addPixmap(pixmap)
                 # Set scene rect to pixmap size
                 self.table_scene.setSceneRect(0, 0, pixmap.width(), pixmap.height())
+                self._scene_center = (pixmap.width() / 2, pixmap.height() / 2)
                 # Fit in view after a short delay to ensure view is sized
                 QtCore.QTimer.singleShot(100, lambda: self.table_view.fitInView(
                     self.table_scene.sceneRect(), QtCore.Qt.AspectRatioMode.KeepAspectRatio))
@@ -284,17 +459,9 @@ class GameWindow(QtWidgets.QMainWindow):
     def setup_players(self):
         """Position players around an oval table."""
         n = len(self.players_data)
-        scene_rect = self.table_scene.sceneRect()
-        if scene_rect.isEmpty():
-            center_x = 600
-            center_y = 400
-            table_w = 1200
-            table_h = 800
-        else:
-            center_x = scene_rect.center().x()
-            center_y = scene_rect.center().y()
-            table_w = scene_rect.width()
-            table_h = scene_rect.height()
+        # The scene rect starts at the origin, so the table spans twice its center
+        center_x, center_y = self._scene_center
+        table_w, table_h = 2 * center_x, 2 * center_y
         
         # Oval table: use different radii for width and height
         # Position players on the oval edge
@@ -302,88 +469,115 @@ class GameWindow(QtWidgets.QMainWindow):
         radius_y = table_h * 0.38  # Vertical radius (taller)
         widget_w, widget_h = 70, 90  # approximate half-size for centering
         
+        # Seat positions on the oval (parametric equation), in scene coordinates:
+        # computed once, window resizes only rescale the view (see resizeEvent)
+        self._player_positions = [
+            (center_x + radius_x * math.cos(angle) - widget_w,
+             center_y + radius_y * math.sin(angle) - widget_h)
+            for angle in ((2 * math.pi * i) / n - math.pi / 2 for i in range(n))
+        ]
+        
         for i, player_data in enumerate(self.players_data):
-            # Angle around the oval
-            angle = (2 * math.pi * i) / n - math.pi / 2
-            
-            # Calculate position on oval (parametric equation)
-            x = center_x + radius_x * math.cos(angle) - widget_w
-            y = center_y + radius_y * math.sin(angle) - widget_h
-            
             player_widget = PlayerWidget(player_data, i, n)
             proxy = self.table_scene.addWidget(player_widget)
             if proxy:
                 proxy.setZValue(5)
-                proxy.setPos(x, y)
+                proxy.setPos(*self._player_positions[i])
             
             self.player_widgets[i] = player_widget
     
+    def resizeEvent(self, event: QtGui.QResizeEvent):
+        """Keep the whole table in view; seats are scene items and scale with it."""
+        super().resizeEvent(event)
+        if not self.table_scene.sceneRect().isEmpty():
+            self.table_view.fitInView(self.table_scene.sceneRect(), QtCore.Qt.AspectRatioMode.KeepAspectRatio)
+    
+    def _create_trick_slot(self):
+        """Create one reusable trick entry (player name over card) in the trick container."""
+        card_widget = QtWidgets.QWidget()
+        card_widget.setFixedSize(55, 110)
+        card_layout = QtWidgets.QVBoxLayout(card_widget)
+        card_layout.setContentsMargins(0, 0, 0, 0)
+        card_layout.setSpacing(3)
+        
+        name_label = QtWidgets.QLabel()
+        name_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        name_label.setObjectName("trickName")
+        card_layout.addWidget(name_label)
+        
+        card_label = QtWidgets.QLabel()
+        card_label.setFixedSize(50, 75)
+        card_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        card_label.setObjectName("trickCard")
+        card_layout.addWidget(card_label)
+        
+        self.trick_cards_layout.addWidget(card_widget, 0, len(self._trick_slots))
+        return card_widget, name_label, card_label
+    
     def update_from_engine(self):
+        """
+        Schedule a GUI refresh from engine state. Requests made before the
+        event loop gets control again are coalesced into a single refresh.
+        """
+        if not self._update_timer.isActive():
+            self._update_timer.start()
+    
+    @QtCore.Slot()
+    def _do_update_from_engine(self):
         """Update GUI from engine state."""
         snapshot = self.engine.snapshot()
         logger.debug(f"Engine snapshot: {snapshot}")
         
         # Check if game is finished
-        if self.engine.phase == Phase.FINE:
+        if self.engine.phase is Phase.FINE:
             self.action_timer.stop()
             self.show_game_over()
             return
         
+        # Each block below is only redrawn when its part of the snapshot changed
+        last = self._last_rendered
+        
         # Update phase label
-        phase_name = snapshot["phase"].upper().replace("_", " ")
-        logger.debug(f"Passing from phase: {self.phase_label.text()} to {phase_name}")
-        self.phase_label.setText(f"Phase: {phase_name}")
+        if snapshot["phase"] != last["phase"]:
+            last["phase"] = snapshot["phase"]
+            phase_text = PHASE_LABELS[snapshot["phase"]]
+            logger.debug(f"Passing from phase: {self.phase_label.text()} to {phase_text}")
+            self.phase_label.setText(phase_text)
         
         # Update briscola card (create if needed)
-        if snapshot["briscola_card"]:
+        if snapshot["briscola_card"] and snapshot["briscola_card"] != last["briscola"]:
+            last["briscola"] = snapshot["briscola_card"]
             if self.briscola_label is None:
                 self.briscola_label = QtWidgets.QLabel()
                 self.briscola_label.setFixedSize(52, 78)
                 self.briscola_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-                self.briscola_label.setStyleSheet("""
-                    QLabel {
-                        border: 2px solid #f39c12;
-                        border-radius: 4px;
-                        background-color: white;
-                    }
-                """)
-                briscola_proxy = self.table_scene.addWidget(self.briscola_label)
-                briscola_proxy.setZValue(1)
+                self.briscola_label.setObjectName("briscolaCard")
+                self.briscola_label.setStyleSheet(TABLE_QSS)
+                self.briscola_proxy = self.table_scene.addWidget(self.briscola_label)
+                self.briscola_proxy.setZValue(1)
             
             briscola_card = snapshot["briscola_card"]
             card = Card(briscola_card["seed"], briscola_card["value"])
             card_path = card_to_sprite_path(card)
-            if card_path.exists():
-                pixmap = QtGui.QPixmap(str(card_path))
-                if not pixmap.isNull():
-                    pixmap = pixmap.scaled(48, 74, QtCore.Qt.KeepAspectRatio,
-                                          QtCore.Qt.SmoothTransformation)
-                    self.briscola_label.setPixmap(pixmap)
+            pixmap = get_scaled_pixmap(card_path, 48, 74)
+            if not pixmap.isNull():
+                self.briscola_label.setPixmap(pixmap)
             
             # Position briscola in center
-            scene_rect = self.table_scene.sceneRect()
-            if not scene_rect.isEmpty():
-                center_x = scene_rect.center().x()
-                center_y = scene_rect.center().y()
-                for item in self.table_scene.items():
-                    if item and item.widget() == self.briscola_label:
-                        item.setPos(center_x - 26, center_y - 90)  # Above trick cards
-                        break
+            center_x, center_y = self._scene_center
+            self.briscola_proxy.setPos(center_x - 26, center_y - 90)  # Above trick cards
         
         # Update current trick display with cards (create if needed)
-        scene_rect = self.table_scene.sceneRect()
-        if scene_rect.isEmpty():
-            center_x = 600
-            center_y = 400
-        else:
-            center_x = scene_rect.center().x()
-            center_y = scene_rect.center().y()
+        center_x, center_y = self._scene_center
         
-        if snapshot["current_trick"] and len(snapshot["current_trick"]) > 0:
+        trick_changed = snapshot["current_trick"] != last["trick"]
+        last["trick"] = snapshot["current_trick"]
+        if trick_changed and snapshot["current_trick"]:
             # Create trick cards container if needed
             if self.trick_cards_container is None:
                 self.trick_cards_container = QtWidgets.QWidget()
-                self.trick_cards_container.setStyleSheet("background-color: transparent;")
+                self.trick_cards_container.setObjectName("trickContainer")
+                self.trick_cards_container.setStyleSheet(TABLE_QSS)
                 trick_layout = QtWidgets.QVBoxLayout(self.trick_cards_container)
                 trick_layout.setContentsMargins(0, 0, 0, 0)
                 trick_layout.setSpacing(5)
@@ -391,51 +585,40 @@ class GameWindow(QtWidgets.QMainWindow):
                 # Title label
                 self.trick_label = QtWidgets.QLabel("Current Trick")
                 self.trick_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-                self.trick_label.setStyleSheet("""
-                    QLabel {
-                        font-size: 11px;
-                        font-weight: bold;
-                        color: white;
-                        background-color: rgba(0, 0, 0, 200);
-                        padding: 4px 8px;
-                        border-radius: 4px;
-                    }
-                """)
+                self.trick_label.setObjectName("trickTitle")
                 trick_layout.addWidget(self.trick_label)
                 
                 # Cards container
-                self.trick_cards_layout = QtWidgets.QHBoxLayout()
+                self.trick_cards_layout = QtWidgets.QGridLayout()
                 self.trick_cards_layout.setContentsMargins(0, 0, 0, 0)
                 self.trick_cards_layout.setSpacing(8)
                 trick_layout.addLayout(self.trick_cards_layout)
                 
-                trick_proxy = self.table_scene.addWidget(self.trick_cards_container)
-                if trick_proxy:
-                    trick_proxy.setZValue(3)
+                # A trick has at most one card per seat: create every slot up front
+                while len(self._trick_slots) < len(self.players_data):
+                    self._trick_slots.append(self._create_trick_slot())
+                    self._trick_slots[-1][0].setVisible(False)
+                
+                self.trick_proxy = self.table_scene.addWidget(self.trick_cards_container)
+                if self.trick_proxy:
+                    self.trick_proxy.setZValue(3)
             
-            # Clear existing trick cards
-            for i in reversed(range(self.trick_cards_layout.count())):
-                item = self.trick_cards_layout.itemAt(i)
-                if item and item.widget():
-                    item.widget().setParent(None)
+            # Fill the reusable trick slots, hiding the ones left over
+            plays = snapshot["current_trick"]
+            while len(self._trick_slots) < len(plays):
+                self._trick_slots.append(self._create_trick_slot())
             
-            # Add cards from current trick
-            for play in snapshot["current_trick"]:
+            for j, (card_widget, name_label, card_label) in enumerate(self._trick_slots):
+                play = plays[j] if j < len(plays) else None
                 try:
-                    actor = play.get("actor", {})
-                    card_data = play.get("card", {})
+                    card_data = play.get("card", {}) if play else None
                     if not card_data:
+                        card_widget.setVisible(False)
                         continue
                     
+                    actor = play.get("actor", {})
                     card = Card(card_data["seed"], card_data["value"])
                     
-                    # Create card widget with player name
-                    card_widget = QtWidgets.QWidget()
-                    card_widget.setFixedSize(55, 110)
-                    card_layout = QtWidgets.QVBoxLayout(card_widget)
-                    card_layout.setContentsMargins(0, 0, 0, 0)
-                    card_layout.setSpacing(3)
-                    
                     # Player name label
                     if actor.get("kind") == "player":
                         player_id = actor.get("id", 0)
@@ -445,67 +628,44 @@ class GameWindow(QtWidgets.QMainWindow):
                             player_name = f"Player {player_id}"
                     else:
                         player_name = f"Buco {actor.get('id', 0)}"
-                    
-                    name_label = QtWidgets.QLabel(player_name)
-                    name_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-                    name_label.setStyleSheet("""
-                        QLabel {
-                            font-size: 9px;
-                            font-weight: bold;
-                            color: white;
-                            background-color: rgba(52, 73, 94, 220);
-                            padding: 2px 4px;
-                            border-radius: 3px;
-                        }
-                    """)
-                    card_layout.addWidget(name_label)
+                    name_label.setText(player_name)
                     
                     # Card image
-                    card_label = QtWidgets.QLabel()
-                    card_label.setFixedSize(50, 75)
-                    card_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-                    card_label.setStyleSheet("""
-                        QLabel {
-                            border: 2px solid #2c3e50;
-                            border-radius: 5px;
-                            background-color: white;
-                        }
-                    """)
-                    
+                    card_label.clear()
                     card_path = card_to_sprite_path(card)
-                    if card_path.exists():
-                        pixmap = QtGui.QPixmap(str(card_path))
-                        if not pixmap.isNull():
-                            pixmap = pixmap.scaled(46, 71, QtCore.Qt.KeepAspectRatio,
-                                                  QtCore.Qt.SmoothTransformation)
-                            card_label.setPixmap(pixmap)
-                    
-                    card_layout.addWidget(card_label)
-                    self.trick_cards_layout.addWidget(card_widget)
-                except Exception as e:
-                    print(f"Error creating trick card widget: {e}")
+                    pixmap = get_scaled_pixmap(card_path, 46, 71)
+                    if not pixmap.isNull():
+                        card_label.setPixmap(pixmap)
+                    card_widget.setVisible(True)
+                except Exception:
+                    logger.exception("Error creating trick card widget")
+                    card_widget.setVisible(False)
                     continue
             
             # Position trick container in center
-            if self.trick_cards_container:
-                for item in self.table_scene.items():
-                    if item and item.widget() == self.trick_cards_container:
-                        # Center the container horizontally, position below briscola
-                        num_cards = len(snapshot["current_trick"])
-                        container_w = 55 * num_cards + 8 * max(0, num_cards - 1)
-                        item.setPos(center_x - container_w / 2, center_y + 20)  # Below briscola
-                        break
-        else:
+            if self.trick_proxy:
+                # Center the container horizontally, position below briscola
+                num_cards = len(snapshot["current_trick"])
+                container_w = 55 * num_cards + 8 * max(0, num_cards - 1)
+                self.trick_proxy.setPos(center_x - container_w / 2, center_y + 20)  # Below briscola
+                self.trick_proxy.setVisible(True)
+        elif trick_changed:
             # Hide trick container if no trick
-            if self.trick_cards_container:
-                for item in self.table_scene.items():
-                    if item and item.widget() == self.trick_cards_container:
-                        item.setPos(-1000, -1000)  # Move off-screen
-                        break
+            if self.trick_proxy:
+                self.trick_proxy.setVisible(False)
         
         # Update player displays
         for i, player_info in enumerate(snapshot["players"]):
             if i in self.player_widgets:
+                fingerprint = (player_info["bankroll"], player_info["tricks_won"], player_info["is_playing"],
+                               player_info["in_buco"], player_info["num_cards"])
+                if i == self.human_player_index:
+                    # A cambi swaps cards without changing the count
+                    fingerprint += (self.engine.get_player_hand(i),)
+                if fingerprint == last["players"].get(i):
+                    continue
+                last["players"][i] = fingerprint
+                
                 widget = self.player_widgets[i]
                 widget.update_bankroll(player_info["bankroll"] / 100.0)  # Convert cents to euros
                 
@@ -520,69 +680,46 @@ class GameWindow(QtWidgets.QMainWindow):
                 
                 # Update cards (with null safety)
                 if widget and widget.cards_layout:
-                    back_path = Path(__file__).parent / "sprites" / "back" / "back.png"
-                    
                     if i == self.human_player_index:
                         # Show human player's cards
                         try:
                             hand = self.engine.get_player_hand(i)
                             if hand is not None:
-                                widget.update_cards(hand, show_front=True, back_path=back_path)
+                                widget.update_cards(hand, show_front=True, back_path=_BACK_PATH)
                             else:
-                                widget.update_cards([], show_front=False, back_path=back_path)
-                        except Exception as e:
-                            print(f"Error updating human player cards: {e}")
-                            widget.update_cards([], show_front=False, back_path=back_path)
+                                widget.update_cards([], show_front=False, back_path=_BACK_PATH)
+                        except Exception:
+                            logger.exception("Error updating human player cards")
+                            widget.update_cards([], show_front=False, back_path=_BACK_PATH)
                     else:
                         # Show back for other players (compact size)
-                        num_cards = player_info.get("num_cards", 0)
-                        card_w, card_h = 38, 56
-                        # Clear existing cards safely
-                        for j in reversed(range(widget.cards_layout.count())):
-                            item = widget.cards_layout.itemAt(j)
-                            if item and item.widget():
-                                w = item.widget()
-                                w.setParent(None)
-                                w.deleteLater()
-                        
-                        for j in range(num_cards):
-                            card_label = QtWidgets.QLabel()
-                            card_label.setFixedSize(card_w, card_h)
-                            card_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-                            card_label.setStyleSheet("""
-                                QLabel {
-                                    border: 1px solid #34495e;
-                                    border-radius: 3px;
-                                    background-color: white;
-                                }
-                            """)
-                            if back_path.exists():
-                                pixmap = QtGui.QPixmap(str(back_path))
-                                if not pixmap.isNull():
-                                    pixmap = pixmap.scaled(card_w - 2, card_h - 2, QtCore.Qt.KeepAspectRatio,
-                                                          QtCore.Qt.SmoothTransformation)
-                                    card_label.setPixmap(pixmap)
-                            widget.cards_layout.addWidget(card_label)
+                        widget.show_card_backs(player_info.get("num_cards", 0), self._back_pixmap)
         
         # Update action buttons
         self.update_action_buttons()
         
-        # Auto-advance for non-human players (with safety check)
+        # Human turns get the countdown; AI turns are played as soon as the loop is idle
         try:
             actor = self.engine.current_actor()
-            if actor is not None:
-                if not (actor.kind == "player" and actor.id == self.human_player_index):
-                    # Non-human player - take action after short delay
-                    QtCore.QTimer.singleShot(500, lambda: self._safe_take_random_action())
-        except Exception as e:
-            print(f"Error in auto-advance: {e}")
+            if actor is None:
+                self.action_timer.stop()
+            elif actor.kind == "player" and actor.id == self.human_player_index:
+                self.start_action_timer()
+            else:
+                self.action_timer.stop()
+                if not self._ai_move_pending:
+                    self._ai_move_pending = True
+                    QtCore.QTimer.singleShot(0, self._safe_take_random_action)
+        except Exception:
+            logger.exception("Error in auto-advance")
     
     def _safe_take_random_action(self):
         """Safely take random action with error handling."""
+        self._ai_move_pending = False
         try:
             self.take_random_action()
-        except Exception as e:
-            print(f"Error taking random action: {e}")
+        except Exception:
+            logger.exception("Error taking random action")
     
     def update_action_buttons(self):
         """Update action buttons based on current phase and legal actions."""
@@ -607,49 +744,34 @@ class GameWindow(QtWidgets.QMainWindow):
             # Other players - will use random actions via timer
             pass
     
+    # Button label for each action kind
+    _ACTION_BUTTON_LABELS = {
+        "keep": lambda a: "Keep",
+        "fold": lambda a: "Fold",
+        "servito": lambda a: "No Change (Servito)",
+        "change_card": lambda a: f"Change Card {a.payload['index'] + 1}",
+        "change_cards": lambda a: f"Change Cards {[i + 1 for i in a.payload['indices']]}",
+        "take_buco": lambda a: "Take Buco",
+        "pass": lambda a: "Pass",
+        "discard": lambda a: f"Discard Card {a.payload['card_index'] + 1}",
+        "play_card": lambda a: f"Play {a.payload['card'].value} di {a.payload['card'].seed}",
+    }
+    
     def create_action_button(self, action: Action) -> Optional[QtWidgets.QPushButton]:
         """Create a button for an action."""
-        if action.kind == "keep":
-            btn = QtWidgets.QPushButton("Keep")
-            btn.clicked.connect(lambda: self.on_action_clicked(action))
-            return btn
-        elif action.kind == "fold":
-            btn = QtWidgets.QPushButton("Fold")
-            btn.clicked.connect(lambda: self.on_action_clicked(action))
-            return btn
-        elif action.kind == "servito":
-            btn = QtWidgets.QPushButton("No Change (Servito)")
-            btn.clicked.connect(lambda: self.on_action_clicked(action))
-            return btn
-        elif action.kind == "change_card":
-            idx = action.payload["index"]
-            btn = QtWidgets.QPushButton(f"Change Card {idx + 1}")
-            btn.clicked.connect(lambda: self.on_action_clicked(action))
-            return btn
-        elif action.kind == "change_cards":
-            indices = action.payload["indices"]
-            btn = QtWidgets.QPushButton(f"Change Cards {[i+1 for i in indices]}")
-            btn.clicked.connect(lambda: self.on_action_clicked(action))
-            return btn
-        elif action.kind == "take_buco":
-            btn = QtWidgets.QPushButton("Take Buco")
-            btn.clicked.connect(lambda: self.on_action_clicked(action))
-            return btn
-        elif action.kind == "pass":
-            btn = QtWidgets.QPushButton("Pass")
-            btn.clicked.connect(lambda: self.on_action_clicked(action))
-            return btn
-        elif action.kind == "discard":
-            idx = action.payload["card_index"]
-            btn = QtWidgets.QPushButton(f"Discard Card {idx + 1}")
-            btn.clicked.connect(lambda: self.on_action_clicked(action))
-            return btn
-        elif action.kind == "play_card":
-            card = action.payload["card"]
-            btn = QtWidgets.QPushButton(f"Play {card.value} di {card.seed}")
-            btn.clicked.connect(lambda: self.on_action_clicked(action))
-            return btn
-        return None
+        label = self._ACTION_BUTTON_LABELS.get(action.kind)
+        if label is None:
+            return None
+        btn = QtWidgets.QPushButton(label(action))
+        # One shared slot for all buttons; the action rides on the button
+        btn.setProperty("action", action)
+        btn.clicked.connect(self._on_action_button_clicked)
+        return btn
+    
+    @QtCore.Slot()
+    def _on_action_button_clicked(self):
+        """Forward a click to on_action_clicked with the action stored on the button."""
+        self.on_action_clicked(self.sender().property("action"))
     
     @QtCore.Slot()
     def on_action_clicked(self, action: Action):
@@ -660,9 +782,8 @@ class GameWindow(QtWidgets.QMainWindow):
             logger.debug(f"Action clicked: {action}")
             self.engine.step(action)
             self.update_from_engine()
-            self.start_action_timer()
         except Exception as e:
-            print(f"Error in action click: {e}")
+            logger.exception("Error in action click")
             QtWidgets.QMessageBox.warning(self, "Invalid Action", str(e))
     
     def start_action_timer(self):
@@ -676,24 +797,13 @@ class GameWindow(QtWidgets.QMainWindow):
         """Update timer label."""
         if self.timer_label:
             self.timer_label.setText(f"{self.timer_seconds}s")
-            if self.timer_seconds <= 5:
-                self.timer_label.setStyleSheet("""
-                    font-size: 18px;
-                    font-weight: bold;
-                    color: #e74c3c;
-                    padding: 5px 15px;
-                    background-color: #fadbd8;
-                    border-radius: 5px;
-                """)
-            else:
-                self.timer_label.setStyleSheet("""
-                    font-size: 18px;
-                    font-weight: bold;
-                    color: #e74c3c;
-                    padding: 5px 15px;
-                    background-color: #ecf0f1;
-                    border-radius: 5px;
-                """)
+            urgent = self.timer_seconds <= 5
+            if urgent != self._timer_urgent:
+                # Property selectors are only re-matched on polish, so restyle on transitions only
+                self._timer_urgent = urgent
+                self.timer_label.setProperty("urgent", urgent)
+                self.timer_label.style().unpolish(self.timer_label)
+                self.timer_label.style().polish(self.timer_label)
     
     @QtCore.Slot()
     def on_timer_timeout(self):
@@ -705,27 +815,20 @@ class GameWindow(QtWidgets.QMainWindow):
                 self.action_timer.stop()
                 return
             
-            # Only count down for human player
-            if actor.kind == "player" and actor.id == self.human_player_index:
-                self.timer_seconds -= 1
-                self.update_timer_display()
-                
-                if self.timer_seconds <= 0:
-                    # Time's up - take first legal action
-                    legal = self.engine.legal_actions()
-                    if legal:
-                        # Auto-select first action
-                        self.engine.step(legal[0])
-                        self.update_from_engine()
-                        self.start_action_timer()
-                    else:
-                        # No legal actions - should not happen
-                        self.action_timer.stop()
-            else:
-                # For other players, take action immediately (no timer)
-                self.take_random_action()
-        except Exception as e:
-            print(f"Error in timer timeout: {e}")
+            # The timer only runs on human turns (see _do_update_from_engine)
+            self.timer_seconds -= 1
+            self.update_timer_display()
+            
+            if self.timer_seconds <= 0:
+                # Time's up - take first legal action
+                self.action_timer.stop()
+                legal = self.engine.legal_actions()
+                if legal:
+                    # Auto-select first action
+                    self.engine.step(legal[0])
+                    self.update_from_engine()
+        except Exception:
+            logger.exception("Error in timer timeout")
             self.action_timer.stop()
     
     def take_random_action(self):
@@ -735,32 +838,28 @@ class GameWindow(QtWidgets.QMainWindow):
             if actor is None:
                 return
             
-            legal = self.engine.legal_actions()
-            if not legal:
+            # Draws one action without building the legal list in the play phase
+            action = self.engine.sample_legal_action(rng=self._ai_rng)
+            if action is None:
                 try:
                     self.engine._run_to_next_decision()
                     self.update_from_engine()
-                    self.start_action_timer()
-                except Exception as e:
-                    print(f"Error running to next decision: {e}")
+                except Exception:
+                    logger.exception("Error running to next decision")
                 return
             
-            # Choose random action
-            action = random.choice(legal)
             logger.debug(f"Random action for {actor.kind} {actor.id}: {action}")
             
             self.engine.step(action)
             self.update_from_engine()
-            self.start_action_timer()
-        except Exception as e:
-            print(f"Error taking random action: {e}")
+        except Exception:
+            logger.exception("Error taking random action")
             # Try to advance anyway
             try:
                 self.engine._run_to_next_decision()
                 self.update_from_engine()
-                self.start_action_timer()
-            except Exception as e2:
-                print(f"Error in fallback advance: {e2}")
+            except Exception:
+                logger.exception("Error in fallback advance")
     
     def show_game_over(self):
         """Show game over dialog."""
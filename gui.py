@@ -5,8 +5,29 @@ from PySide6 import QtWidgets, QtCore, QtGui
 import sys
 logger = logging.getLogger(__name__)
 
+# Main menu button look, shared through the Menu widget
+_MENU_STYLE = """
+    QPushButton#menuBtn {
+        background-color: #4CAF50;
+        color: white;
+        border: none;
+        border-radius: 5px;
+        padding: 6px 12px;
+        }
+    QPushButton#menuBtn:hover {
+        background-color: #45a049;
+        }
+    QPushButton#menuBtn:pressed {
+        background-color: #3e8e41;
+        }
+"""
+
+
 class PlayerRow(QtWidgets.QWidget):
     # One row in the NewGameDialog for a single player.
+    # Scaled photo previews shared by all rows, keyed by (path, mtime)
+    _pixmap_cache: dict[tuple[str, float], QtGui.QPixmap] = {}
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.photo_path: str | None = None
@@ -58,10 +79,15 @@ class PlayerRow(QtWidgets.QWidget):
         if not path:
             return
         self.photo_path = path
-        pixmap = QtGui.QPixmap(path)
-        if not pixmap.isNull():
+        key = (path, Path(path).stat().st_mtime)
+        pixmap = self._pixmap_cache.get(key)
+        if pixmap is None:
+            pixmap = QtGui.QPixmap(path)
+            if pixmap.isNull():
+                return
             pixmap = pixmap.scaled(48,48,QtCore.Qt.KeepAspectRatioByExpanding, QtCore.Qt.SmoothTransformation)
-            self.photo_lbl.setPixmap(pixmap)
+            self._pixmap_cache[key] = pixmap
+        self.photo_lbl.setPixmap(pixmap)
     def to_data(self) -> dict:
         return {
             "name": self.name_edit.text().strip(),
@@ -125,12 +151,16 @@ class NewGameDialog(QtWidgets.QDialog):
     @QtCore.Slot()
     def on_add_player_clicked(self):
         row = PlayerRow(self)
-        row.remove_btn.clicked.connect(lambda: self.on_remove_player_clicked(row))
+        # One shared slot for every row; the row is the clicked button's parent
+        row.remove_btn.clicked.connect(self._on_remove_button_clicked)
 
         self.list_layout.insertWidget(self.list_layout.count() - 1, row)
         self.rows.append(row)
 
     @QtCore.Slot()
+    def _on_remove_button_clicked(self):
+        self.on_remove_player_clicked(self.sender().parent())
+
     def on_remove_player_clicked(self, row: PlayerRow):
         if row in self.rows:
             self.rows.remove(row)
@@ -138,12 +168,14 @@ class NewGameDialog(QtWidgets.QDialog):
             row.deleteLater()
 
     def get_players(self) -> list[dict]:
-        return [row.to_data() for row in self.rows if row.to_data()["name"]]
+        data = [row.to_data() for row in self.rows]
+        return [d for d in data if d["name"]]
 
     def on_confirm(self):
         players = self.get_players()
         
-        players_valid = [p for p in players if p["name"] and p["bankroll"] > 0]
+        # get_players() already dropped unnamed rows
+        players_valid = [p for p in players if p["bankroll"] > 0]
         if len(players_valid) < 4:
             QtWidgets.QMessageBox.warning(self, "Invalid Players", "Please add at least 4 players with valid names and bankrolls.")
             return 
@@ -179,22 +211,9 @@ class Menu(QtWidgets.QWidget):
         for button in [self.play, self.options, self.exit]:
             button.setMinimumSize(button_width, button_height)
             button.setMaximumSize(button_width, button_height)
-            button.setStyleSheet("""
-                QPushButton {
-                    background-color: #4CAF50;
-                    color: white;
-                    border: none;
-                    border-radius: 5px;
-                    padding: 6px 12px;
-                    }
-                QPushButton:hover {
-                    background-color: #45a049;
-                    }
-                QPushButton:pressed {
-                    background-color: #3e8e41;
-                    }
-
-            """)
+            button.setObjectName("menuBtn")
+        # Set once on the menu; the #menuBtn rules cascade to the buttons
+        self.setStyleSheet(_MENU_STYLE)
         
         # Main layout
         main_layout = QtWidgets.QVBoxLayout()
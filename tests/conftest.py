@@ -0,0 +1,8 @@
+"""Shared test fixtures."""
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def no_pacing_sleep(monkeypatch):
+    """Tests never wait on the engine's GUI pacing pauses."""
+    monkeypatch.setattr("engine.smazzata.time.sleep", lambda s: None)
@@ -0,0 +1,16 @@
+"""Helpers for driving an Engine through scripted phases in tests."""
+from typing import Union
+
+from engine.smazzata import Action, Engine, Phase
+
+
+def advance_through(engine: Engine, phase: Union[Phase, str], action: Action) -> None:
+    """
+    Answer every decision with `action` until the engine leaves `phase`.
+    Also stops if the phase has no pending decision, instead of spinning.
+    """
+    target = Phase(phase)
+    step = engine.step
+    has_current_actor = engine.has_current_actor
+    while engine.phase is target and has_current_actor():
+        step(action)
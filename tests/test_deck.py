@@ -0,0 +1,128 @@
+"""Tests for the integer card encoding and the deck buffer."""
+import random
+
+import pytest
+
+from engine.deck import (
+    ALL_CARDS, Card, Deck, RANK_STRENGTH, RANK_STRENGTH_T, SEEDS, SUIT_ID, SUIT_MASKS, VALUES,
+    encode_card, card_suit, card_rank, compare_cards, mask_codes,
+)
+
+
+def test_encoding_roundtrip():
+    """Every card encodes to a distinct code that decodes back to itself."""
+    codes = set()
+    for seed in SEEDS:
+        for value in VALUES:
+            code = encode_card(seed, value)
+            assert SEEDS[card_suit(code)] == seed
+            assert Card.from_code(code) == Card(seed, value)
+            codes.add(code)
+    assert len(codes) == 40
+
+
+def test_rank_field_follows_briscola_order():
+    """Comparing rank fields gives the same order as RANK_STRENGTH."""
+    for a in VALUES:
+        for b in VALUES:
+            rank_a = card_rank(encode_card("Coppe", a))
+            rank_b = card_rank(encode_card("Coppe", b))
+            assert (rank_a > rank_b) == (RANK_STRENGTH[a] > RANK_STRENGTH[b])
+        assert RANK_STRENGTH_T[card_rank(encode_card("Coppe", a))] == RANK_STRENGTH[a]
+
+
+def test_compare_cards_led_suit():
+    """Off-suit non-briscola cards cannot be ranked against the led suit."""
+    assert compare_cards("Coppe", "Denari", Card("Coppe", "3"), Card("Coppe", "Re")) > 0
+    assert compare_cards("Coppe", "Denari", Card("Spade", "Asso"), Card("Coppe", "2")) == 0
+    assert compare_cards("Coppe", "Denari", Card("Denari", "2"), Card("Coppe", "Asso")) > 0
+
+
+def test_deck_draws_every_card_once():
+    """A shuffled deck yields all 40 encoded cards exactly once."""
+    deck = Deck(seed=7)
+    deck.shuffle()
+    drawn = [deck.draw() for _ in range(40)]
+    assert sorted(drawn) == sorted(encode_card(s, v) for s in SEEDS for v in VALUES)
+    assert len(deck) == 0
+
+
+def test_draw_many_matches_draw():
+    """draw_many(k) returns the same cards as k successive draw() calls."""
+    deck_a = Deck(seed=3)
+    deck_b = Deck(seed=3)
+    deck_a.shuffle()
+    deck_b.shuffle()
+    assert list(deck_a.draw_many(3)) == [deck_b.draw() for _ in range(3)]
+    assert len(deck_a) == len(deck_b) == 37
+
+
+def test_indexing_only_sees_undrawn_cards():
+    """Deck indexing covers cards[0..top] like a list of the undrawn cards."""
+    deck = Deck(seed=2)
+    deck.shuffle()
+    deck.draw_many(38)
+    assert [deck[0], deck[1]] == list(deck.cards[:2])
+    assert deck[-1] == deck[1]
+    assert list(deck[:]) == list(deck.cards[:2])
+    with pytest.raises(IndexError):
+        deck[2]
+    with pytest.raises(IndexError):
+        deck[2] = deck[0]
+
+
+def test_shuffle_keeps_drawn_cards_out():
+    """Shuffling a partly drawn deck only reorders the undrawn cards."""
+    deck = Deck(seed=9)
+    deck.shuffle()
+    remaining = sorted(deck.cards[:30])
+    drawn = set(deck.draw_many(10))
+    deck.shuffle()
+    assert len(deck) == 30
+    assert sorted(deck[:]) == remaining
+    assert not drawn & {deck.draw() for _ in range(30)}
+
+
+def test_shuffle_with_external_rng():
+    """shuffle(rng) uses the given generator, as a fresh Deck(seed) would."""
+    deck_a = Deck()
+    deck_b = Deck(seed=5)
+    deck_a.shuffle(random.Random(5))
+    deck_b.shuffle()
+    assert deck_a.cards == deck_b.cards
+
+
+def test_reset_refills_deck_in_place():
+    """reset() restores a full deck reusing the same buffer."""
+    deck = Deck(seed=1)
+    deck.shuffle()
+    buffer = deck.cards
+    deck.draw_many(10)
+    deck.reset()
+    assert deck.cards is buffer
+    assert len(deck) == 40
+
+
+def test_suit_masks_and_mask_codes():
+    """SUIT_MASKS partition the deck and mask_codes decodes a hand in code order."""
+    assert sum(m.bit_count() for m in SUIT_MASKS) == 40
+    hand = (1 << encode_card("Spade", "Re")) | (1 << encode_card("Coppe", "2"))
+    assert mask_codes(hand) == [encode_card("Coppe", "2"), encode_card("Spade", "Re")]
+    assert mask_codes(hand & SUIT_MASKS[SUIT_ID["Spade"]]) == [encode_card("Spade", "Re")]
+
+
+def test_cards_are_interned():
+    """Constructing or decoding a card always yields the ALL_CARDS instance."""
+    assert len(ALL_CARDS) == 40
+    for card in ALL_CARDS:
+        assert Card(card.seed, card.value) is card
+        assert Card.from_code(card.code) is card
+
+
+def test_cards_are_immutable():
+    """Interned cards cannot be modified or given new attributes."""
+    card = Card("Coppe", "Re")
+    for name in ("seed", "code", "extra"):
+        with pytest.raises(AttributeError):
+            setattr(card, name, 0)
+    assert card.seed == "Coppe"
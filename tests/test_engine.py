@@ -0,0 +1,100 @@
+"""Tests for engine lifecycle."""
+import pytest
+
+from engine.deck import ALL_CARDS
+from engine.smazzata import Engine, Player, Action, Phase, KEEP, FOLD, SERVITO, TAKE_BUCO
+
+
+def test_engine_reset_matches_new_engine():
+    """reset() reuses the engine and deals exactly like a fresh one."""
+    engine = Engine([Player("P1"), Player("P2"), Player("P3")], pot=300, dealer=1, seed=11)
+    engine.gs.players[0].hand = 0b111
+    deck = engine.gs.deck
+    
+    engine.reset(pot=120, dealer=2, seed=7)
+    fresh = Engine([Player("P1"), Player("P2"), Player("P3")], pot=120, dealer=2, seed=7)
+    
+    assert engine.gs.deck is deck
+    assert engine.snapshot() == fresh.snapshot()
+    assert engine.snapshot_bytes() == fresh.snapshot_bytes()
+
+
+def test_step_rejects_card_outside_legal_mask():
+    """step() checks play_card actions against the legal play mask."""
+    engine = Engine([Player("P1"), Player("P2"), Player("P3")], pot=300, seed=42)
+    while engine.phase is Phase.DEAL_DECIDE:
+        engine.step(KEEP)
+    while engine.phase is Phase.CAMBI:
+        engine.step(SERVITO)
+    assert engine.phase is Phase.PLAY
+    
+    actor = engine.current_actor()
+    hand = engine.get_player_hand(actor.id)
+    outside = next(card for card in ALL_CARDS if card not in hand)
+    with pytest.raises(ValueError):
+        engine.step(Action("play_card", {"card": outside}))
+    with pytest.raises(ValueError):
+        engine.step(KEEP)
+    
+    legal = engine.legal_actions()
+    engine.step(legal[0], validate=False)
+    assert engine.current_actor() != actor
+
+
+def test_rollout_matches_step_driven_hand():
+    """rollout() ends in the same state as the same decisions made through step()."""
+    lowest = lambda seat, mask: (mask & -mask).bit_length() - 1
+    
+    rolled = Engine([Player("P1"), Player("P2"), Player("P3")], pot=300, seed=5)
+    won = rolled.rollout(lambda idx, hand: True, lambda idx, hand: 0, lowest)
+    
+    stepped = Engine([Player("P1"), Player("P2"), Player("P3")], pot=300, seed=5)
+    while stepped.phase is not Phase.FINE:
+        legal = stepped.legal_actions()
+        if stepped.phase is Phase.PLAY:
+            stepped.step(min(legal, key=lambda a: a.payload["card"].code))
+        else:
+            stepped.step(KEEP if KEEP in legal else SERVITO)
+    
+    assert rolled.phase is Phase.FINE
+    assert rolled.snapshot() == stepped.snapshot()
+    assert sum(won.values()) == 3
+
+
+def test_rollout_rejects_all_fold():
+    """rollout() raises instead of hanging when nobody keeps."""
+    engine = Engine([Player("P1"), Player("P2"), Player("P3")], seed=1)
+    with pytest.raises(ValueError):
+        engine.rollout(lambda idx, hand: False, lambda idx, hand: 0, None)
+    # The hand is still playable through step(): discarders may take the buco
+    assert engine.phase is Phase.BUCHI_ENTRY
+    assert TAKE_BUCO in engine.legal_actions()
+
+
+def test_random_play_reproducible_from_engine_seed():
+    """sample_legal_action() and play_out() draw from the engine's seeded generator."""
+    def play(seed):
+        engine = Engine([Player("P1"), Player("P2"), Player("P3")], seed=seed, pacing=0)
+        while engine.phase is not Phase.PLAY:
+            engine.step(engine.sample_legal_action())
+        engine.play_out()
+        return engine.snapshot()
+    
+    assert play(6) == play(6)
+
+
+def test_legal_actions_cached_per_decision():
+    """legal_actions() is computed once per decision point."""
+    engine = Engine([Player("P1"), Player("P2"), Player("P3")], seed=4)
+    legal = engine.legal_actions()
+    assert engine._cached_legal_actions() is engine._cached_legal_actions()
+    
+    # Each call hands out its own list, so mutating one leaves the cache intact
+    legal.clear()
+    assert engine.legal_actions() == [KEEP, FOLD]
+    
+    version = engine.state_version
+    cached = engine._cached_legal_actions()
+    engine.step(KEEP)
+    assert engine.state_version > version
+    assert engine._cached_legal_actions() is not cached
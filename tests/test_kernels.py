@@ -0,0 +1,50 @@
+"""Tests for the integer trick kernels."""
+from engine.deck import ALL_CODES, SUIT_ID, encode_card
+from engine.kernels import BEATS, legal_follow_mask, play_out, trick_key, trick_winner
+
+
+def test_trick_winner_led_suit():
+    """Highest card of the led suit wins when no briscola is played."""
+    cards = [encode_card("Coppe", "Re"), encode_card("Spade", "Asso"), encode_card("Coppe", "3")]
+    assert trick_winner(cards, 3, SUIT_ID["Coppe"], SUIT_ID["Denari"]) == 2
+
+
+def test_trick_winner_briscola():
+    """Any briscola beats the led suit, highest briscola wins."""
+    cards = [encode_card("Coppe", "Asso"), encode_card("Denari", "2"), encode_card("Denari", "Fante")]
+    assert trick_winner(cards, 3, SUIT_ID["Coppe"], SUIT_ID["Denari"]) == 2
+    assert trick_winner(cards, 2, SUIT_ID["Coppe"], SUIT_ID["Denari"]) == 1
+
+
+def test_legal_follow_mask_must_beat():
+    """Following suit, only cards beating the winner are playable when available."""
+    hand = (1 << encode_card("Coppe", "2")) | (1 << encode_card("Coppe", "Asso")) | (1 << encode_card("Denari", "3"))
+    winner = encode_card("Coppe", "Re")
+    assert legal_follow_mask(hand, SUIT_ID["Coppe"], SUIT_ID["Denari"], winner) == 1 << encode_card("Coppe", "Asso")
+
+
+def test_legal_follow_mask_briscola_when_void():
+    """Without cards of the led suit, briscola must be played."""
+    hand = (1 << encode_card("Spade", "Asso")) | (1 << encode_card("Denari", "2"))
+    winner = encode_card("Coppe", "Re")
+    assert legal_follow_mask(hand, SUIT_ID["Coppe"], SUIT_ID["Denari"], winner) == 1 << encode_card("Denari", "2")
+
+
+def test_beats_table_matches_trick_key():
+    """BEATS rows hold exactly the cards with a higher trick key."""
+    lead, briscola = SUIT_ID["Coppe"], SUIT_ID["Denari"]
+    for winner in ALL_CODES:
+        expected = sum(1 << c for c in ALL_CODES
+                       if trick_key(c, lead, briscola) > trick_key(winner, lead, briscola))
+        assert BEATS[briscola][lead][winner] == expected
+
+
+def test_play_out_single_trick():
+    """play_out follows the lead and awards the trick to the highest briscola."""
+    denari = SUIT_ID["Denari"]
+    hands = [1 << encode_card("Coppe", "Re"), 1 << encode_card("Denari", "2"), 1 << encode_card("Coppe", "Asso")]
+    log = []
+    won = play_out(hands, 0, 1, denari, lambda seat, mask: (mask & -mask).bit_length() - 1, log=log)
+    assert won == [0, 1, 0]
+    assert hands == [0, 0, 0]
+    assert [seat for seat, _ in log] == [0, 1, 2]
@@ -0,0 +1,21 @@
+"""Tests for the packed int action fast path."""
+import pytest
+
+from engine.smazzata import Engine, Player, pack_action, unpack_action
+
+
+def test_legal_actions_int_matches_legal_actions():
+    """Packed legal actions decode to the same list as legal_actions()."""
+    engine = Engine([Player("P1"), Player("P2"), Player("P3")], pot=300, seed=4)
+    packed = engine.legal_actions_int()
+    
+    assert packed == [pack_action(a) for a in engine.legal_actions()]
+    assert [unpack_action(a) for a in packed] == engine.legal_actions()
+
+
+def test_step_int_rejects_illegal_action():
+    """step_int validates like step()."""
+    engine = Engine([Player("P1"), Player("P2"), Player("P3")], seed=4)
+    illegal = max(engine.legal_actions_int()) + 1
+    with pytest.raises(ValueError):
+        engine.step_int(illegal)
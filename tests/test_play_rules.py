@@ -1,47 +1,41 @@
 """Tests for play phase rules: palo, briscola, ammazzare sempre, di mano."""
 import pytest
 from engine.smazzata import Engine, Player, Action, Phase
+from engine.smazzata import KEEP, SERVITO, PASS
 from engine.deck import Card, compare_cards
+from tests.helpers import advance_through
 
 
-def test_palo_obligation():
+def _new_engine(seed=None) -> Engine:
+    return Engine([Player("P1"), Player("P2"), Player("P3")], pot=300, seed=seed, pacing=0)
+
+
+@pytest.fixture(scope="module", params=[42, 44, 45])
+def play_phase_state(request):
+    """
+    Binary snapshot of a 3-player hand driven to the play phase: everyone
+    keeps, nobody changes cards, nobody takes a buco. Driven once per seed
+    for the whole module.
+    """
+    engine = _new_engine(request.param)
+    advance_through(engine, Phase.DEAL_DECIDE, KEEP)
+    advance_through(engine, Phase.CAMBI, SERVITO)
+    advance_through(engine, Phase.BUCHI_ENTRY, PASS)
+    assert engine.phase is Phase.PLAY
+    return bytes(engine.snapshot_bytes())
+
+
+@pytest.fixture
+def engine_at_play(play_phase_state):
+    """A fresh engine restored to the shared play-phase state."""
+    engine = _new_engine()
+    engine.restore_bytes(play_phase_state)
+    return engine
+
+
+def test_palo_obligation(engine_at_play):
     """Test that players must follow suit (palo) when possible."""
-    players = [Player("P1"), Player("P2"), Player("P3")]
-    engine = Engine(players, pot=300, seed=42)
-    
-    # Get through deal and cambi phases
-    # P1 keeps
-    while engine.phase.value == "deal_decide":
-        actor = engine.current_actor()
-        if actor:
-            engine.step(Action("keep", {}))
-    
-    # P2 keeps
-    while engine.phase.value == "deal_decide":
-        actor = engine.current_actor()
-        if actor:
-            engine.step(Action("keep", {}))
-    
-    # P3 keeps
-    while engine.phase.value == "deal_decide":
-        actor = engine.current_actor()
-        if actor:
-            engine.step(Action("keep", {}))
-    
-    # Skip cambi (all servito)
-    while engine.phase.value == "cambi":
-        actor = engine.current_actor()
-        if actor:
-            engine.step(Action("servito", {}))
-    
-    # Skip buchi
-    while engine.phase.value == "buchi_entry":
-        actor = engine.current_actor()
-        if actor:
-            engine.step(Action("pass", {}))
-    
-    # Now in play phase
-    assert engine.phase.value == "play"
+    engine = engine_at_play
     
     # Get first player's hand
     actor = engine.current_actor()
@@ -89,33 +83,9 @@ def test_briscola_obligation():
     assert compare_cards(lead_suit, briscola_suit, non_briscola_card, briscola_card) < 0
 
 
-def test_ammazzare_sempre():
+def test_ammazzare_sempre(engine_at_play):
     """Test that players must beat current winner when possible (ammazzare sempre)."""
-    players = [Player("P1"), Player("P2"), Player("P3")]
-    engine = Engine(players, pot=300, seed=44)
-    
-    # Get to play phase
-    # P1, P2, P3 all keep
-    for _ in range(3):
-        while engine.phase.value == "deal_decide":
-            actor = engine.current_actor()
-            if actor:
-                engine.step(Action("keep", {}))
-    
-    # All servito
-    while engine.phase.value == "cambi":
-        actor = engine.current_actor()
-        if actor:
-            engine.step(Action("servito", {}))
-    
-    # Skip buchi
-    while engine.phase.value == "buchi_entry":
-        actor = engine.current_actor()
-        if actor:
-            engine.step(Action("pass", {}))
-    
-    # In play phase
-    assert engine.phase.value == "play"
+    engine = engine_at_play
     
     # First player leads
     actor = engine.current_actor()
@@ -136,29 +106,9 @@ def test_ammazzare_sempre():
     assert len(legal) > 0
 
 
-def test_di_mano_asso_briscola():
+def test_di_mano_asso_briscola(engine_at_play):
     """Test that di mano must play Asso of Briscola if they have it."""
-    players = [Player("P1"), Player("P2"), Player("P3")]
-    engine = Engine(players, pot=300, seed=45)
-    
-    # Get to play phase
-    for _ in range(3):
-        while engine.phase.value == "deal_decide":
-            actor = engine.current_actor()
-            if actor:
-                engine.step(Action("keep", {}))
-    
-    while engine.phase.value == "cambi":
-        actor = engine.current_actor()
-        if actor:
-            engine.step(Action("servito", {}))
-    
-    while engine.phase.value == "buchi_entry":
-        actor = engine.current_actor()
-        if actor:
-            engine.step(Action("pass", {}))
-    
-    assert engine.phase.value == "play"
+    engine = engine_at_play
     
     # Check if first player has Asso of Briscola
     actor = engine.current_actor()
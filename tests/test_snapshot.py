@@ -0,0 +1,48 @@
+"""Tests for the binary engine snapshot."""
+import pickle
+
+from engine.smazzata import Engine, Player
+
+
+def test_snapshot_bytes_roundtrip():
+    """Restoring a binary snapshot reproduces the same state and legal actions."""
+    engine = Engine([Player("P1"), Player("P2"), Player("P3")], pot=300, dealer=1, seed=11)
+    packed = engine.snapshot_bytes()
+    
+    other = Engine([Player("P1"), Player("P2"), Player("P3")], seed=5)
+    other.restore_bytes(packed)
+    
+    assert other.snapshot() == engine.snapshot()
+    assert other.legal_actions() == engine.legal_actions()
+    assert other.gs.players[2].hand == engine.gs.players[2].hand
+    assert other.snapshot_bytes() == packed
+
+
+def test_snapshot_bytes_reuses_buffer():
+    """A buffer passed in is filled in place and returned."""
+    engine = Engine([Player("P1"), Player("P2"), Player("P3")], seed=2)
+    buf = bytearray()
+    assert engine.snapshot_bytes(buf) is buf
+    assert bytes(buf) == bytes(engine.snapshot_bytes())
+
+
+def test_game_state_pickle_roundtrip():
+    """GameState survives a protocol 5 pickle round trip."""
+    engine = Engine([Player("P1"), Player("P2"), Player("P3")], pot=300, seed=8)
+    expected = engine.snapshot()
+    
+    engine.gs = pickle.loads(pickle.dumps(engine.gs, protocol=5))
+    
+    assert engine.snapshot() == expected
+    assert [p.name for p in engine.gs.players] == ["P1", "P2", "P3"]
+
+
+def test_snapshot_cached_until_state_changes():
+    """Repeated snapshot() polls reuse one dict until the engine moves on."""
+    engine = Engine([Player("P1"), Player("P2"), Player("P3")], seed=4)
+    first = engine.snapshot()
+    assert engine.snapshot() is first
+    
+    engine.step(engine.legal_actions()[0])
+    assert engine.snapshot() is not first
+    assert engine.snapshot() is engine.snapshot()